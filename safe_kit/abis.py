@@ -109,6 +109,16 @@ SAFE_ABI: list[dict[str, Any]] = [
         "stateMutability": "view",
         "type": "function",
     },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "offset", "type": "uint256"},
+            {"internalType": "uint256", "name": "length", "type": "uint256"},
+        ],
+        "name": "getStorageAt",
+        "outputs": [{"internalType": "bytes", "name": "", "type": "bytes"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
     {
         "inputs": [],
         "name": "getChainId",
@@ -364,3 +374,34 @@ MULTI_SEND_ABI: list[dict[str, Any]] = [
         "type": "function",
     }
 ]
+
+MULTICALL3_ABI: list[dict[str, Any]] = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from eth_account.messages import encode_defunct, encode_typed_data
 from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3 import Web3
 
+from safe_kit.abis import SAFE_ABI
+
 
 class EthAdapter(ABC):
     """
@@ -71,16 +75,18 @@ class Web3Adapter(EthAdapter):
     def __init__(self, web3: Web3, signer: LocalAccount | None = None):
         self.web3 = web3
         self.signer = signer
+        self._chain_id: int | None = None
 
     def get_balance(self, address: str) -> int:
         return self.web3.eth.get_balance(self.web3.to_checksum_address(address))
 
     def get_chain_id(self) -> int:
-        return self.web3.eth.chain_id
+        # The chain of a connected node does not change, so query it only once
+        if self._chain_id is None:
+            self._chain_id = self.web3.eth.chain_id
+        return self._chain_id
 
     def get_safe_contract(self, safe_address: str) -> Any:
-        from safe_kit.abis import SAFE_ABI
-
         return self.web3.eth.contract(
             address=self.web3.to_checksum_address(safe_address), abi=SAFE_ABI
         )
@@ -99,8 +105,6 @@ class Web3Adapter(EthAdapter):
         if not self.signer:
             raise ValueError("No signer available")
 
-        from eth_account.messages import encode_defunct
-
         if isinstance(message, bytes):
             signable_message = encode_defunct(primitive=message)
         elif message.startswith("0x"):
@@ -114,7 +118,6 @@ class Web3Adapter(EthAdapter):
     def sign_typed_data(self, data: dict[str, Any]) -> str:
         if not self.signer:
             raise ValueError("No signer available")
-        from eth_account.messages import encode_typed_data
 
         signable_message = encode_typed_data(full_message=data)
         signed_message = self.signer.sign_message(signable_message)  # type: ignore[no-untyped-call]
@@ -141,8 +144,6 @@ class Web3Adapter(EthAdapter):
         return self.web3.to_checksum_address(address)
 
     def wait_for_transaction_receipt(self, tx_hash: str, timeout: int = 120) -> Any:
-        from hexbytes import HexBytes
-
         return self.web3.eth.wait_for_transaction_receipt(
             HexBytes(tx_hash), timeout=timeout
         )
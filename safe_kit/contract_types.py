@@ -47,6 +47,11 @@ class SafeRequiredTxGasParams(TypedDict):
     signatures: bytes
 
 
+class SafeGetStorageAtParams(TypedDict):
+    offset: int
+    length: int
+
+
 class SafeIsOwnerParams(TypedDict):
     owner: str
 
@@ -9,6 +9,13 @@ from safe_kit.types import SafeTransaction, SafeTransactionData
 if TYPE_CHECKING:
     from safe_kit.safe import Safe
 
+# keccak256("guard_manager.guard.address")
+GUARD_STORAGE_SLOT = 0x4A204F620C8C5CCDCA3FD54D003B6D13435454A733A569F8E4A6426EA62BF7A0
+# keccak256("fallback_manager.handler.address")
+FALLBACK_HANDLER_STORAGE_SLOT = (
+    0x6C9A6C4A39284E37ED1CF53D337577D14212A4870FB976A4366C693B939918D5
+)
+
 
 class GuardManagerMixin:
     """
@@ -19,9 +26,7 @@ class GuardManagerMixin:
         """
         Returns the guard address of the Safe.
         """
-        # keccak256("guard_manager.guard.address")
-        slot = 0x4A204F620C8C5CCDCA3FD54D003B6D13435454A733A569F8E4A6426EA62BF7A0
-        data = self.eth_adapter.get_storage_at(self.safe_address, slot)
+        data = self.eth_adapter.get_storage_at(self.safe_address, GUARD_STORAGE_SLOT)
         # Convert bytes to address (last 20 bytes)
         return "0x" + data.hex()[-40:]
 
@@ -41,9 +46,9 @@ class GuardManagerMixin:
         """
         Returns the fallback handler address of the Safe.
         """
-        # keccak256("fallback_manager.handler.address")
-        slot = 0x6C9A6C4A39284E37ED1CF53D337577D14212A4870FB976A4366C693B939918D5
-        data = self.eth_adapter.get_storage_at(self.safe_address, slot)
+        data = self.eth_adapter.get_storage_at(
+            self.safe_address, FALLBACK_HANDLER_STORAGE_SLOT
+        )
         return "0x" + data.hex()[-40:]
 
     def create_set_fallback_handler_transaction(  # type: ignore[misc]
@@ -4,11 +4,19 @@ Module management functionality for Safe.
 
 from typing import TYPE_CHECKING, cast
 
-from safe_kit.types import SafeTransaction, SafeTransactionData
+from safe_kit.types import (
+    SENTINEL_ADDRESS,
+    ZERO_ADDRESS,
+    SafeTransaction,
+    SafeTransactionData,
+)
 
 if TYPE_CHECKING:
     from safe_kit.safe import Safe
 
+# Large enough that every practical Safe returns its modules in a single call
+MODULES_PAGE_SIZE = 1000
+
 
 class ModuleManagerMixin:
     """
@@ -19,21 +27,16 @@ class ModuleManagerMixin:
         """
         Returns the modules enabled on the Safe.
         """
-        # Sentinel address for modules
-        start = "0x0000000000000000000000000000000000000001"
-        page_size = 10
+        start = SENTINEL_ADDRESS
         modules = []
 
         while True:
             array, next_module = self.contract.functions.getModulesPaginated(
-                start, page_size
+                start, MODULES_PAGE_SIZE
             ).call()
             modules.extend(array)
 
-            if (
-                next_module == "0x0000000000000000000000000000000000000001"
-                or next_module == "0x0000000000000000000000000000000000000000"
-            ):
+            if next_module in (SENTINEL_ADDRESS, ZERO_ADDRESS):
                 break
             start = next_module
 
@@ -72,7 +75,7 @@ class ModuleManagerMixin:
             raise ValueError(f"Module {module_address} is not enabled") from None
 
         if index == 0:
-            prev_module = "0x0000000000000000000000000000000000000001"
+            prev_module = SENTINEL_ADDRESS
         else:
             prev_module = modules[index - 1]
 
@@ -4,7 +4,7 @@ Owner management functionality for Safe.
 
 from typing import TYPE_CHECKING
 
-from safe_kit.types import SafeTransaction, SafeTransactionData
+from safe_kit.types import SENTINEL_ADDRESS, SafeTransaction, SafeTransactionData
 
 if TYPE_CHECKING:
     from safe_kit.safe import Safe
@@ -15,18 +15,22 @@ class OwnerManagerMixin:
     Mixin class providing owner management functionality.
     """
 
-    def _get_previous_owner(self: "Safe", owner: str) -> str:  # type: ignore[misc]
+    def _get_previous_owner(  # type: ignore[misc]
+        self: "Safe", owner: str, owners: list[str] | None = None
+    ) -> str:
         """
         Get the previous owner in the linked list for removal/swap operations.
+        Reads the owners from the contract unless `owners` is given.
         """
-        owners = self.get_owners()
+        if owners is None:
+            owners = self.get_owners()
         try:
             index = owners.index(owner)
         except ValueError:
             raise ValueError(f"Address {owner} is not an owner") from None
 
         if index == 0:
-            return "0x0000000000000000000000000000000000000001"  # Sentinel
+            return SENTINEL_ADDRESS
         return owners[index - 1]
 
     def create_add_owner_transaction(  # type: ignore[misc]
@@ -47,15 +51,20 @@ class OwnerManagerMixin:
         )
 
     def create_remove_owner_transaction(  # type: ignore[misc]
-        self: "Safe", owner: str, threshold: int | None = None
+        self: "Safe",
+        owner: str,
+        threshold: int | None = None,
+        owners: list[str] | None = None,
     ) -> SafeTransaction:
         """
         Creates a transaction to remove an owner from the Safe.
+        Pass the current `owners`, e.g. from get_owners or get_state_bundle, to
+        skip reading them again when building several owner changes.
         """
         if not self.is_owner(owner):
             raise ValueError(f"Address {owner} is not an owner")
 
-        prev_owner = self._get_previous_owner(owner)
+        prev_owner = self._get_previous_owner(owner, owners)
 
         data = self.contract.encodeABI(
             fn_name="removeOwner", args=[prev_owner, owner, threshold]
@@ -66,10 +75,14 @@ class OwnerManagerMixin:
         )
 
     def create_swap_owner_transaction(  # type: ignore[misc]
-        self: "Safe", old_owner: str, new_owner: str
+        self: "Safe",
+        old_owner: str,
+        new_owner: str,
+        owners: list[str] | None = None,
     ) -> SafeTransaction:
         """
         Creates a transaction to replace an existing owner with a new one.
+        Pass the current `owners` to skip reading them again.
         """
         if not self.is_owner(old_owner):
             raise ValueError(f"Address {old_owner} is not an owner")
@@ -77,7 +90,7 @@ class OwnerManagerMixin:
         if self.is_owner(new_owner):
             raise ValueError(f"Address {new_owner} is already an owner")
 
-        prev_owner = self._get_previous_owner(old_owner)
+        prev_owner = self._get_previous_owner(old_owner, owners)
 
         data = self.contract.encodeABI(
             fn_name="swapOwner", args=[prev_owner, old_owner, new_owner]
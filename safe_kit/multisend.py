@@ -1,7 +1,12 @@
-from hexbytes import HexBytes
+import struct
 
 from safe_kit.types import SafeTransactionData
 
+# operation (uint8) + to (address)
+_HEADER = struct.Struct(">B20s")
+# Header plus the value and data length words
+_FIXED_SIZE = _HEADER.size + 64
+
 
 class MultiSend:
     """
@@ -18,24 +23,24 @@ class MultiSend:
         operation (1 byte) + to (20 bytes) + value (32 bytes) +
         data_length (32 bytes) + data (bytes)
         """
-        encoded_data = b""
-        for tx in transactions:
-            # operation: 1 byte
-            operation = int(tx.operation).to_bytes(1, byteorder="big")
-
-            # to: 20 bytes
-            # Ensure it's bytes and 20 bytes long
-            to_address = HexBytes(tx.to)
+        # Decode each payload once, both to size the buffer and to pack it
+        payloads = [tx.data_bytes for tx in transactions]
+        buffer = bytearray(
+            len(payloads) * _FIXED_SIZE + sum(len(data) for data in payloads)
+        )
+        offset = 0
+        for tx, data in zip(transactions, payloads, strict=True):
+            to_address = bytes.fromhex(tx.to.removeprefix("0x"))
             if len(to_address) != 20:
                 raise ValueError(f"Invalid address length for {tx.to}")
 
-            # value: 32 bytes
-            value = int(tx.value).to_bytes(32, byteorder="big")
-
-            # data
-            data = HexBytes(tx.data)
-            data_length = len(data).to_bytes(32, byteorder="big")
-
-            encoded_data += operation + to_address + value + data_length + data
+            _HEADER.pack_into(buffer, offset, int(tx.operation), to_address)
+            offset += _HEADER.size
+            buffer[offset : offset + 32] = int(tx.value).to_bytes(32, byteorder="big")
+            offset += 32
+            buffer[offset : offset + 32] = len(data).to_bytes(32, byteorder="big")
+            offset += 32
+            buffer[offset : offset + len(data)] = data
+            offset += len(data)
 
-        return encoded_data
+        return bytes(buffer)
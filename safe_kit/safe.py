@@ -1,7 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
+from eth_abi.abi import decode
+from eth_hash.auto import keccak
 from hexbytes import HexBytes
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 
+from safe_kit.abis import MULTICALL3_ABI
 from safe_kit.adapter import EthAdapter
 from safe_kit.contract_types import (
     SafeApproveHashParams,
@@ -17,10 +22,38 @@ from safe_kit.managers import (
     OwnerManagerMixin,
     TokenManagerMixin,
 )
-from safe_kit.types import SafeTransaction, SafeTransactionData
+from safe_kit.managers.guard_manager import (
+    FALLBACK_HANDLER_STORAGE_SLOT,
+    GUARD_STORAGE_SLOT,
+)
+from safe_kit.managers.module_manager import MODULES_PAGE_SIZE
+from safe_kit.types import (
+    SENTINEL_ADDRESS,
+    ZERO_ADDRESS,
+    SafeState,
+    SafeTransaction,
+    SafeTransactionData,
+)
 
 EIP1271_MAGIC_VALUE = "0x1626ba7e"
 
+# Canonical Multicall3 deployment, at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Safe calls batched by get_state_bundle: function, arguments, output types
+_STATE_BUNDLE_CALLS: list[tuple[str, list[Any], list[str]]] = [
+    ("nonce", [], ["uint256"]),
+    ("getThreshold", [], ["uint256"]),
+    ("getOwners", [], ["address[]"]),
+    (
+        "getModulesPaginated",
+        [SENTINEL_ADDRESS, MODULES_PAGE_SIZE],
+        ["address[]", "address"],
+    ),
+    ("getStorageAt", [GUARD_STORAGE_SLOT, 1], ["bytes"]),
+    ("getStorageAt", [FALLBACK_HANDLER_STORAGE_SLOT, 1], ["bytes"]),
+]
+
 
 class Safe(
     OwnerManagerMixin,
@@ -105,6 +138,73 @@ class Safe(
         """
         return cast(list[str], self.contract.functions.getOwners().call())
 
+    def get_state_bundle(self) -> SafeState:
+        """
+        Returns the nonce, threshold, owners, modules, guard and fallback
+        handler of the Safe, read in a single eth_call through Multicall3.
+        Falls back to concurrent reads when Multicall3 is not deployed on the
+        chain or the Safe has no getStorageAt (versions before 1.1.0).
+        """
+        calls = [
+            (
+                self.safe_address,
+                False,
+                self.contract.encodeABI(fn_name=fn_name, args=args),
+            )
+            for fn_name, args, _ in _STATE_BUNDLE_CALLS
+        ]
+        multicall = self.eth_adapter.get_contract(MULTICALL3_ADDRESS, MULTICALL3_ABI)
+        try:
+            results = multicall.functions.aggregate3(calls).call()
+        except (BadFunctionCallOutput, ContractLogicError):
+            return self._get_state_bundle_concurrently()
+
+        (
+            (nonce,),
+            (threshold,),
+            (owners,),
+            (modules, next_module),
+            (guard,),
+            (fallback_handler,),
+        ) = (
+            decode(output_types, return_data)
+            for (_, _, output_types), (_, return_data) in zip(
+                _STATE_BUNDLE_CALLS, results, strict=True
+            )
+        )
+        if next_module not in (SENTINEL_ADDRESS, ZERO_ADDRESS):
+            # More modules than fit in one page
+            modules = self.get_modules()
+
+        return SafeState(
+            nonce=nonce,
+            threshold=threshold,
+            owners=owners,
+            modules=modules,
+            guard="0x" + guard.hex()[-40:],
+            fallback_handler="0x" + fallback_handler.hex()[-40:],
+        )
+
+    def _get_state_bundle_concurrently(self) -> SafeState:
+        """
+        Reads the state bundle with one call per field, issued concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            nonce = executor.submit(self.get_nonce)
+            threshold = executor.submit(self.get_threshold)
+            owners = executor.submit(self.get_owners)
+            modules = executor.submit(self.get_modules)
+            guard = executor.submit(self.get_guard)
+            fallback_handler = executor.submit(self.get_fallback_handler)
+        return SafeState(
+            nonce=nonce.result(),
+            threshold=threshold.result(),
+            owners=owners.result(),
+            modules=modules.result(),
+            guard=guard.result(),
+            fallback_handler=fallback_handler.result(),
+        )
+
     def is_owner(self, address: str) -> bool:
         """
         Checks if an address is an owner of the Safe.
@@ -134,7 +234,8 @@ class Safe(
         if not signer_address:
             raise ValueError("No signer configured in the adapter")
 
-        chain_id = self.eth_adapter.get_chain_id()
+        # A chain ID given at construction was already checked against the adapter
+        chain_id = self.chain_id or self.eth_adapter.get_chain_id()
 
         if method == "eth_sign_typed_data":
             eip712_data = safe_transaction.data.get_eip712_data(
@@ -145,14 +246,10 @@ class Safe(
             tx_hash = self.get_transaction_hash(safe_transaction)
             signature = self.eth_adapter.sign_message(tx_hash)
             # Adjust v for eth_sign: v += 4
-            # Signature is r(32) + s(32) + v(1)
-            # We need to parse it, adjust v, and reconstruct
-            sig_bytes = HexBytes(signature)
-            r = sig_bytes[:32]
-            s = sig_bytes[32:64]
-            v = sig_bytes[64]
-            v += 4
-            signature = (r + s + bytes([v])).hex()
+            # Signature is r(32) + s(32) + v(1), so v is patched in place
+            sig_bytes = bytearray(HexBytes(signature))
+            sig_bytes[64] += 4
+            signature = sig_bytes.hex()
         else:
             raise ValueError(f"Unsupported signing method: {method}")
 
@@ -195,7 +292,7 @@ class Safe(
         params: SafeGetTransactionHashParams = {
             "to": safe_transaction.data.to,
             "value": safe_transaction.data.value,
-            "data": HexBytes(safe_transaction.data.data),
+            "data": safe_transaction.data.data_bytes,
             "operation": safe_transaction.data.operation,
             "safeTxGas": safe_transaction.data.safe_tx_gas,
             "baseGas": safe_transaction.data.base_gas,
@@ -243,7 +340,7 @@ class Safe(
             params: SafeExecTransactionParams = {
                 "to": safe_transaction.data.to,
                 "value": safe_transaction.data.value,
-                "data": HexBytes(safe_transaction.data.data),
+                "data": safe_transaction.data.data_bytes,
                 "operation": safe_transaction.data.operation,
                 "safeTxGas": safe_transaction.data.safe_tx_gas,
                 "baseGas": safe_transaction.data.base_gas,
@@ -279,7 +376,7 @@ class Safe(
             params: SafeExecTransactionParams = {
                 "to": safe_transaction.data.to,
                 "value": safe_transaction.data.value,
-                "data": HexBytes(safe_transaction.data.data),
+                "data": safe_transaction.data.data_bytes,
                 "operation": safe_transaction.data.operation,
                 "safeTxGas": safe_transaction.data.safe_tx_gas,
                 "baseGas": safe_transaction.data.base_gas,
@@ -306,7 +403,7 @@ class Safe(
         params: SafeRequiredTxGasParams = {
             "to": safe_transaction.data.to,
             "value": safe_transaction.data.value,
-            "data": HexBytes(safe_transaction.data.data),
+            "data": safe_transaction.data.data_bytes,
             "operation": safe_transaction.data.operation,
             "safeTxGas": safe_transaction.data.safe_tx_gas,
             "baseGas": safe_transaction.data.base_gas,
@@ -328,7 +425,7 @@ class Safe(
         params: SafeExecTransactionParams = {
             "to": safe_transaction.data.to,
             "value": safe_transaction.data.value,
-            "data": HexBytes(safe_transaction.data.data),
+            "data": safe_transaction.data.data_bytes,
             "operation": safe_transaction.data.operation,
             "safeTxGas": safe_transaction.data.safe_tx_gas,
             "baseGas": safe_transaction.data.base_gas,
@@ -356,7 +453,7 @@ class Safe(
 
         self.contract.functions.checkSignatures(
             tx_hash_bytes,
-            HexBytes(safe_transaction.data.data),
+            safe_transaction.data.data_bytes,
             safe_transaction.sorted_signatures_bytes,
         ).call()
 
@@ -387,8 +484,6 @@ class Safe(
             raise TypeError("message must be str or bytes")
 
         # keccak256(message)
-        from eth_hash.auto import keccak
-
         message_hash = keccak(message_bytes)
 
         result = self.contract.functions.getMessageHash(message_hash).call().hex()
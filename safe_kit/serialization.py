@@ -0,0 +1,144 @@
+"""
+Pluggable JSON (de)serialization for the Safe Transaction Service client.
+
+The fastest available backend is selected at import time, probing ``orjson``,
+``cysimdjson`` and ``simdjson`` in that order and falling back to the standard
+library. Set the ``SAFE_KIT_JSON_BACKEND`` environment variable to ``orjson``,
+``cysimdjson``, ``simdjson`` or ``json`` to force a specific backend.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Any, Protocol
+
+JSON_BACKEND_ENV_VAR = "SAFE_KIT_JSON_BACKEND"
+
+# Integers that may fall outside orjson's range: 20 or more digits can exceed
+# the unsigned 64-bit maximum, and a negative one with 19 or more digits can go
+# below the signed 64-bit minimum
+_WIDE_INTEGER = re.compile(rb"-\d{19}|\d{20}")
+
+
+class JsonBackend(Protocol):
+    """
+    Minimal interface shared by all JSON backends.
+    """
+
+    name: str
+
+    def loads(self, data: bytes) -> Any: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+
+class StdlibJsonBackend:
+    """
+    Backend built on the standard library ``json`` module.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonBackend(StdlibJsonBackend):
+    """
+    Backend built on ``orjson``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        if _WIDE_INTEGER.search(data):
+            # orjson turns integers wider than 64 bits (e.g. uint256 balances)
+            # into floats, so let the standard library keep them exact
+            return super().loads(data)
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # orjson refuses integers wider than 64 bits (e.g. wei amounts)
+            return super().dumps(obj)
+
+
+class CysimdjsonBackend(StdlibJsonBackend):
+    """
+    Backend built on ``cysimdjson``. Encoding uses the standard library.
+    """
+
+    name = "cysimdjson"
+
+    def __init__(self) -> None:
+        import cysimdjson
+
+        self._cysimdjson = cysimdjson
+        # Parsers keep internal buffers and must not be shared across threads
+        self._local = threading.local()
+
+    def loads(self, data: bytes) -> Any:
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = self._cysimdjson.JSONParser()
+        return parser.parse(data).export()
+
+
+class SimdjsonBackend(StdlibJsonBackend):
+    """
+    Backend built on ``pysimdjson``. Encoding uses the standard library.
+    """
+
+    name = "simdjson"
+
+    def __init__(self) -> None:
+        import simdjson
+
+        self._simdjson = simdjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._simdjson.loads(data)
+
+
+JSON_BACKENDS: dict[str, type[StdlibJsonBackend]] = {
+    "orjson": OrjsonBackend,
+    "cysimdjson": CysimdjsonBackend,
+    "simdjson": SimdjsonBackend,
+    "json": StdlibJsonBackend,
+}
+
+
+def get_json_backend(name: str | None = None) -> JsonBackend:
+    """
+    Returns the JSON backend called ``name``, or the fastest one available.
+    """
+    if name:
+        try:
+            backend_cls = JSON_BACKENDS[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown JSON backend {name!r}, expected one of "
+                f"{', '.join(JSON_BACKENDS)}"
+            ) from None
+        return backend_cls()
+
+    for backend_cls in JSON_BACKENDS.values():
+        try:
+            return backend_cls()
+        except ImportError:
+            continue
+    return StdlibJsonBackend()
+
+
+json_backend: JsonBackend = get_json_backend(os.environ.get(JSON_BACKEND_ENV_VAR))
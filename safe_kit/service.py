@@ -1,9 +1,22 @@
-from typing import Any, cast
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Any, TypeVar, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from safe_kit.errors import SafeServiceError
+from safe_kit.serialization import json_backend
 from safe_kit.types import (
+    DECODER_BALANCES,
+    DECODER_COLLECTIBLES,
+    DECODER_DELEGATES,
+    DECODER_INCOMING,
+    DECODER_MODULE,
+    DECODER_MULTISIG,
+    DECODER_TOKENS,
     SafeBalanceResponse,
     SafeCollectibleResponse,
     SafeCreationInfoResponse,
@@ -18,6 +31,28 @@ from safe_kit.types import (
     SafeTransactionData,
 )
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Only advertise Brotli when urllib3 can actually decode it, otherwise the
+# service may answer with a body we cannot read.
+ACCEPT_ENCODING = (
+    "br, gzip" if find_spec("brotli") or find_spec("brotlicffi") else "gzip"
+)
+JSON_HEADERS = {"Content-Type": "application/json"}
+MAX_CONCURRENT_REQUESTS = 16
+
+# Shared, read-only query strings for the balance and collectible endpoints
+_BALANCE_PARAMS = {
+    (trusted, exclude_spam): {
+        "trusted": str(trusted).lower(),
+        "exclude_spam": str(exclude_spam).lower(),
+    }
+    for trusted in (True, False)
+    for exclude_spam in (True, False)
+}
+
 
 class SafeServiceClient:
     """
@@ -26,25 +61,52 @@ class SafeServiceClient:
 
     def __init__(self, service_url: str):
         self.service_url = service_url.rstrip("/")
-
-    def _handle_response(self, response: requests.Response) -> Any:
+        self._session = requests.Session()
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        # Keep one pooled connection per concurrent worker
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def _handle_response(
+        self,
+        response: requests.Response,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        logger.debug(
+            "%s %s -> %s (Content-Encoding: %s)",
+            response.request.method,
+            response.url,
+            response.status_code,
+            response.headers.get("Content-Encoding", "identity"),
+        )
         try:
             response.raise_for_status()
+            if decode is not None:
+                return decode(response.content)
             if response.content:
-                return response.json()
+                return json_backend.loads(response.content)
             return None
         except requests.HTTPError as e:
             raise SafeServiceError(f"Service error: {e}", response.status_code) from e
         except Exception as e:
             raise SafeServiceError(f"Unexpected error: {e}") from e
 
+    def _decode_response(
+        self, response: requests.Response, decode: Callable[[bytes], T]
+    ) -> T:
+        """
+        Decodes the raw response body with ``decode``, typically a pydantic
+        validator that builds models straight from the JSON bytes.
+        """
+        return cast(T, self._handle_response(response, decode))
+
     def get_service_info(self) -> SafeServiceInfo:
         """
         Returns information about the Safe Transaction Service.
         """
-        response = requests.get(f"{self.service_url}/v1/about/")
-        data = self._handle_response(response)
-        return SafeServiceInfo(**data)
+        response = self._session.get(f"{self.service_url}/v1/about/")
+        return self._decode_response(response, SafeServiceInfo.model_validate_json)
 
     def propose_transaction(
         self,
@@ -77,7 +139,9 @@ class SafeServiceClient:
             "origin": origin,
         }
 
-        response = requests.post(url, json=payload)
+        response = self._session.post(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
         self._handle_response(response)
 
     def get_pending_transactions(
@@ -122,10 +186,8 @@ class SafeServiceClient:
         if offset is not None:
             params["offset"] = str(offset)
 
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        results = data.get("results", [])
-        return [SafeMultisigTransactionResponse(**tx) for tx in results]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_MULTISIG.decode)
 
     def confirm_transaction(self, safe_tx_hash: str, signature: str) -> None:
         """
@@ -136,7 +198,9 @@ class SafeServiceClient:
         )
         payload = {"signature": signature}
 
-        response = requests.post(url, json=payload)
+        response = self._session.post(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
         self._handle_response(response)
 
     def delete_transaction(self, safe_tx_hash: str, signature: str) -> None:
@@ -146,7 +210,9 @@ class SafeServiceClient:
         """
         url = f"{self.service_url}/v1/multisig-transactions/{safe_tx_hash}/"
         payload = {"signature": signature}
-        response = requests.delete(url, json=payload)
+        response = self._session.delete(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
         self._handle_response(response)
 
     def get_transaction(self, safe_tx_hash: str) -> SafeMultisigTransactionResponse:
@@ -154,16 +220,17 @@ class SafeServiceClient:
         Returns the details of a specific Safe transaction.
         """
         url = f"{self.service_url}/v1/multisig-transactions/{safe_tx_hash}/"
-        response = requests.get(url)
-        data = self._handle_response(response)
-        return SafeMultisigTransactionResponse(**data)
+        response = self._session.get(url)
+        return self._decode_response(
+            response, SafeMultisigTransactionResponse.model_validate_json
+        )
 
     def get_safes_by_owner(self, owner_address: str) -> list[str]:
         """
         Returns the list of Safes owned by an address.
         """
         url = f"{self.service_url}/v1/owners/{owner_address}/safes/"
-        response = requests.get(url)
+        response = self._session.get(url)
         data = self._handle_response(response)
         return cast(list[str], data.get("safes", []))
 
@@ -174,13 +241,9 @@ class SafeServiceClient:
         Returns the balances of a Safe (ETH and ERC20).
         """
         url = f"{self.service_url}/v1/safes/{safe_address}/balances/"
-        params = {
-            "trusted": str(trusted).lower(),
-            "exclude_spam": str(exclude_spam).lower(),
-        }
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        return [SafeBalanceResponse(**item) for item in data]
+        params = _BALANCE_PARAMS[(trusted, exclude_spam)]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_BALANCES.validate_json)
 
     def get_incoming_transactions(
         self,
@@ -201,10 +264,8 @@ class SafeServiceClient:
         if offset is not None:
             params["offset"] = str(offset)
 
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        results = data.get("results", [])
-        return [SafeIncomingTransactionResponse(**tx) for tx in results]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_INCOMING.decode)
 
     def get_module_transactions(
         self,
@@ -222,28 +283,42 @@ class SafeServiceClient:
         if offset is not None:
             params["offset"] = str(offset)
 
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        results = data.get("results", [])
-        return [SafeModuleTransactionResponse(**tx) for tx in results]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_MODULE.decode)
 
     def get_safe_info(self, safe_address: str) -> SafeInfoResponse:
         """
         Returns detailed information about a Safe.
         """
         url = f"{self.service_url}/v1/safes/{safe_address}/"
-        response = requests.get(url)
-        data = self._handle_response(response)
-        return SafeInfoResponse(**data)
+        response = self._session.get(url)
+        return self._decode_response(response, SafeInfoResponse.model_validate_json)
+
+    def get_safes_with_info_by_owner(
+        self, owner_address: str
+    ) -> list[tuple[str, SafeInfoResponse]]:
+        """
+        Returns the Safes owned by an address together with their details.
+        The per-Safe lookups are issued concurrently over the shared session.
+        """
+        safes = self.get_safes_by_owner(owner_address)
+        if not safes:
+            return []
+
+        workers = min(MAX_CONCURRENT_REQUESTS, len(safes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = list(executor.map(self.get_safe_info, safes))
+        return list(zip(safes, infos, strict=True))
 
     def get_creation_info(self, safe_address: str) -> SafeCreationInfoResponse:
         """
         Returns information about when and how a Safe was created.
         """
         url = f"{self.service_url}/v1/safes/{safe_address}/creation/"
-        response = requests.get(url)
-        data = self._handle_response(response)
-        return SafeCreationInfoResponse(**data)
+        response = self._session.get(url)
+        return self._decode_response(
+            response, SafeCreationInfoResponse.model_validate_json
+        )
 
     def get_collectibles(
         self,
@@ -255,13 +330,9 @@ class SafeServiceClient:
         Returns NFTs (ERC721) owned by the Safe.
         """
         url = f"{self.service_url}/v1/safes/{safe_address}/collectibles/"
-        params = {
-            "trusted": str(trusted).lower(),
-            "exclude_spam": str(exclude_spam).lower(),
-        }
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        return [SafeCollectibleResponse(**item) for item in data]
+        params = _BALANCE_PARAMS[(trusted, exclude_spam)]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_COLLECTIBLES.validate_json)
 
     def get_delegates(self, safe_address: str) -> list[SafeDelegateResponse]:
         """
@@ -269,10 +340,8 @@ class SafeServiceClient:
         """
         url = f"{self.service_url}/v1/delegates/"
         params = {"safe": safe_address}
-        response = requests.get(url, params=params)
-        data = self._handle_response(response)
-        results = data.get("results", [])
-        return [SafeDelegateResponse(**item) for item in results]
+        response = self._session.get(url, params=params)
+        return self._decode_response(response, DECODER_DELEGATES.decode)
 
     def add_delegate(
         self,
@@ -293,7 +362,9 @@ class SafeServiceClient:
             "label": label,
             "signature": signature,
         }
-        response = requests.post(url, json=payload)
+        response = self._session.post(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
         self._handle_response(response)
 
     def remove_delegate(
@@ -310,7 +381,9 @@ class SafeServiceClient:
             "delegator": delegator,
             "signature": signature,
         }
-        response = requests.delete(url, json=payload)
+        response = self._session.delete(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
         self._handle_response(response)
 
     def get_tokens(self) -> list[SafeTokenResponse]:
@@ -318,19 +391,16 @@ class SafeServiceClient:
         Returns the list of ERC20 tokens supported by the Safe Transaction Service.
         """
         url = f"{self.service_url}/v1/tokens/"
-        response = requests.get(url)
-        data = self._handle_response(response)
-        results = data.get("results", [])
-        return [SafeTokenResponse(**item) for item in results]
+        response = self._session.get(url)
+        return self._decode_response(response, DECODER_TOKENS.decode)
 
     def get_token(self, token_address: str) -> SafeTokenResponse:
         """
         Returns information about a specific token.
         """
         url = f"{self.service_url}/v1/tokens/{token_address}/"
-        response = requests.get(url)
-        data = self._handle_response(response)
-        return SafeTokenResponse(**data)
+        response = self._session.get(url)
+        return self._decode_response(response, SafeTokenResponse.model_validate_json)
 
     def decode_data(self, data: str) -> SafeDataDecoderResponse:
         """
@@ -338,6 +408,9 @@ class SafeServiceClient:
         """
         url = f"{self.service_url}/v1/data-decoder/"
         payload = {"data": data}
-        response = requests.post(url, json=payload)
-        data_json = self._handle_response(response)
-        return SafeDataDecoderResponse(**data_json)
+        response = self._session.post(
+            url, data=json_backend.dumps(payload), headers=JSON_HEADERS
+        )
+        return self._decode_response(
+            response, SafeDataDecoderResponse.model_validate_json
+        )
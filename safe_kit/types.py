@@ -1,6 +1,46 @@
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Final, Generic, TypeVar
+
+from hexbytes import HexBytes
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# The zero address is its own checksum form, so it never needs converting
+ZERO_ADDRESS: Final[str] = "0x0000000000000000000000000000000000000000"
+
+# Head and tail of the owner and module linked lists kept by the Safe contract
+SENTINEL_ADDRESS: Final[str] = "0x0000000000000000000000000000000000000001"
+
+# EIP-712 schema of a Safe transaction. Shared by every call to
+# get_eip712_data; eth-account only reads it.
+_EIP712_TYPES: dict[str, list[dict[str, str]]] = {
+    "EIP712Domain": [
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "SafeTx": [
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "data", "type": "bytes"},
+        {"name": "operation", "type": "uint8"},
+        {"name": "safeTxGas", "type": "uint256"},
+        {"name": "baseGas", "type": "uint256"},
+        {"name": "gasPrice", "type": "uint256"},
+        {"name": "gasToken", "type": "address"},
+        {"name": "refundReceiver", "type": "address"},
+        {"name": "nonce", "type": "uint256"},
+    ],
+}
+
+
+def _hex_to_bytes(value: str) -> bytes:
+    """
+    Decodes a hex string as HexBytes does, taking the faster bytes.fromhex
+    path for well-formed input.
+    """
+    try:
+        return bytes.fromhex(value.removeprefix("0x"))
+    except ValueError:
+        # Odd length or an uppercase "0X" prefix
+        return bytes(HexBytes(value))
 
 
 class SafeAccountConfig(BaseModel):
@@ -10,12 +50,12 @@ class SafeAccountConfig(BaseModel):
 
     owners: list[str]
     threshold: int
-    to: str = "0x0000000000000000000000000000000000000000"
+    to: str = ZERO_ADDRESS
     data: str = "0x"
-    fallback_handler: str = "0x0000000000000000000000000000000000000000"
-    payment_token: str = "0x0000000000000000000000000000000000000000"
+    fallback_handler: str = ZERO_ADDRESS
+    payment_token: str = ZERO_ADDRESS
     payment: int = 0
-    payment_receiver: str = "0x0000000000000000000000000000000000000000"
+    payment_receiver: str = ZERO_ADDRESS
 
 
 class SafeTransactionData(BaseModel):
@@ -30,34 +70,30 @@ class SafeTransactionData(BaseModel):
     safe_tx_gas: int = 0
     base_gas: int = 0
     gas_price: int = 0
-    gas_token: str = "0x0000000000000000000000000000000000000000"
-    refund_receiver: str = "0x0000000000000000000000000000000000000000"
+    gas_token: str = ZERO_ADDRESS
+    refund_receiver: str = ZERO_ADDRESS
     nonce: int | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def get_eip712_data(self, chain_id: int, safe_address: str) -> dict[str, Any]:
-        from hexbytes import HexBytes
+    @property
+    def data_bytes(self) -> bytes:
+        """
+        The transaction data decoded to bytes.
+        """
+        return _hex_to_bytes(self.data)
 
+    @property
+    def multisend_encoded_len(self) -> int:
+        """
+        Size of this transaction once packed by MultiSend: operation (1) +
+        to (20) + value (32) + data length (32) + data.
+        """
+        return 85 + len(self.data_bytes)
+
+    def get_eip712_data(self, chain_id: int, safe_address: str) -> dict[str, Any]:
         return {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-                "SafeTx": [
-                    {"name": "to", "type": "address"},
-                    {"name": "value", "type": "uint256"},
-                    {"name": "data", "type": "bytes"},
-                    {"name": "operation", "type": "uint8"},
-                    {"name": "safeTxGas", "type": "uint256"},
-                    {"name": "baseGas", "type": "uint256"},
-                    {"name": "gasPrice", "type": "uint256"},
-                    {"name": "gasToken", "type": "address"},
-                    {"name": "refundReceiver", "type": "address"},
-                    {"name": "nonce", "type": "uint256"},
-                ],
-            },
+            "types": _EIP712_TYPES,
             "primaryType": "SafeTx",
             "domain": {
                 "chainId": chain_id,
@@ -66,7 +102,7 @@ class SafeTransactionData(BaseModel):
             "message": {
                 "to": self.to,
                 "value": self.value,
-                "data": HexBytes(self.data),
+                "data": self.data_bytes,
                 "operation": self.operation,
                 "safeTxGas": self.safe_tx_gas,
                 "baseGas": self.base_gas,
@@ -78,6 +114,29 @@ class SafeTransactionData(BaseModel):
         }
 
 
+def _owner_sort_key(owner: str) -> str:
+    """
+    Addresses are fixed-width hex, so their lowercase digits sort in the same
+    order as their numeric values without parsing them into integers.
+    """
+    return owner.lower().removeprefix("0x")
+
+
+class SafeState(BaseModel):
+    """
+    Snapshot of the on-chain configuration of a Safe.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    nonce: int
+    threshold: int
+    owners: list[str]
+    modules: list[str]
+    guard: str
+    fallback_handler: str
+
+
 class SafeTransaction(BaseModel):
     """
     Model representing a complete Safe transaction including signatures.
@@ -91,17 +150,29 @@ class SafeTransaction(BaseModel):
 
     @property
     def sorted_signatures_bytes(self) -> bytes:
-        from hexbytes import HexBytes
+        """
+        The signatures concatenated in ascending owner order, as expected by
+        the Safe contract.
+        """
+        signatures = self.signatures
+        return b"".join(
+            _hex_to_bytes(signatures[owner])
+            for owner in sorted(signatures, key=_owner_sort_key)
+        )
+
 
-        # Sort by owner address
-        sorted_owners = sorted(self.signatures.keys(), key=lambda x: int(x, 16))
-        signature_bytes = b""
-        for owner in sorted_owners:
-            signature_bytes += HexBytes(self.signatures[owner])
-        return signature_bytes
+ServiceResponseT = TypeVar("ServiceResponseT", bound="_ServiceResponse")
 
 
-class SafeServiceInfo(BaseModel):
+class _ServiceResponse(BaseModel):
+    """
+    Base class for read-only payloads returned by the Safe Transaction Service.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class SafeServiceInfo(_ServiceResponse):
     name: str
     version: str
     api_version: str
@@ -109,7 +180,7 @@ class SafeServiceInfo(BaseModel):
     settings: dict[str, Any]
 
 
-class SafeMultisigTransactionResponse(BaseModel):
+class SafeMultisigTransactionResponse(_ServiceResponse):
     safe: str
     to: str
     value: str
@@ -143,13 +214,13 @@ class SafeMultisigTransactionResponse(BaseModel):
     signatures: str | None
 
 
-class SafeBalanceResponse(BaseModel):
+class SafeBalanceResponse(_ServiceResponse):
     token_address: str | None = Field(alias="tokenAddress")
     token: dict[str, Any] | None
     balance: str
 
 
-class SafeIncomingTransactionResponse(BaseModel):
+class SafeIncomingTransactionResponse(_ServiceResponse):
     execution_date: str = Field(alias="executionDate")
     transaction_hash: str = Field(alias="transactionHash")
     to: str
@@ -158,7 +229,7 @@ class SafeIncomingTransactionResponse(BaseModel):
     from_: str = Field(alias="from")
 
 
-class SafeModuleTransactionResponse(BaseModel):
+class SafeModuleTransactionResponse(_ServiceResponse):
     created: str
     execution_date: str = Field(alias="executionDate")
     block_number: int = Field(alias="blockNumber")
@@ -173,7 +244,7 @@ class SafeModuleTransactionResponse(BaseModel):
     data_decoded: dict[str, Any] | None = Field(alias="dataDecoded")
 
 
-class SafeInfoResponse(BaseModel):
+class SafeInfoResponse(_ServiceResponse):
     """Information about a Safe from the Transaction Service."""
 
     address: str
@@ -187,7 +258,7 @@ class SafeInfoResponse(BaseModel):
     version: str | None
 
 
-class SafeCreationInfoResponse(BaseModel):
+class SafeCreationInfoResponse(_ServiceResponse):
     """Information about Safe creation."""
 
     created: str
@@ -198,7 +269,7 @@ class SafeCreationInfoResponse(BaseModel):
     setup_data: str | None = Field(alias="setupData")
 
 
-class SafeCollectibleResponse(BaseModel):
+class SafeCollectibleResponse(_ServiceResponse):
     """NFT/Collectible owned by a Safe."""
 
     address: str
@@ -213,7 +284,7 @@ class SafeCollectibleResponse(BaseModel):
     metadata: dict[str, Any] | None
 
 
-class SafeDelegateResponse(BaseModel):
+class SafeDelegateResponse(_ServiceResponse):
     """Delegate for a Safe."""
 
     safe: str | None
@@ -222,7 +293,7 @@ class SafeDelegateResponse(BaseModel):
     label: str
 
 
-class SafeTokenResponse(BaseModel):
+class SafeTokenResponse(_ServiceResponse):
     """Information about a Token."""
 
     address: str
@@ -232,8 +303,43 @@ class SafeTokenResponse(BaseModel):
     logo_uri: str | None = Field(alias="logoUri")
 
 
-class SafeDataDecoderResponse(BaseModel):
+class SafeDataDecoderResponse(_ServiceResponse):
     """Decoded data from the Safe Transaction Service."""
 
     method: str
     parameters: list[dict[str, Any]] | None
+
+
+# Validate raw response bytes straight into models in a single pydantic-core
+# pass, without materializing intermediate Python dicts.
+DECODER_BALANCES = TypeAdapter(list[SafeBalanceResponse])
+DECODER_COLLECTIBLES = TypeAdapter(list[SafeCollectibleResponse])
+
+
+class _Page(BaseModel, Generic[ServiceResponseT]):
+    results: list[ServiceResponseT] = []
+
+
+class _PageDecoder(Generic[ServiceResponseT]):
+    """
+    Validates a paginated Transaction Service response body and returns its
+    ``results`` as models, in a single pydantic-core pass.
+    """
+
+    __slots__ = ("_adapter",)
+
+    def __init__(self, model: type[ServiceResponseT]):
+        self._adapter = TypeAdapter(_Page[model])  # type: ignore[valid-type]
+
+    def decode(self, content: bytes) -> list[ServiceResponseT]:
+        if not content:
+            return []
+        results: list[ServiceResponseT] = self._adapter.validate_json(content).results
+        return results
+
+
+DECODER_MULTISIG = _PageDecoder(SafeMultisigTransactionResponse)
+DECODER_INCOMING = _PageDecoder(SafeIncomingTransactionResponse)
+DECODER_MODULE = _PageDecoder(SafeModuleTransactionResponse)
+DECODER_DELEGATES = _PageDecoder(SafeDelegateResponse)
+DECODER_TOKENS = _PageDecoder(SafeTokenResponse)
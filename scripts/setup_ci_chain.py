@@ -1,10 +1,12 @@
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import requests
 from eth_typing import ChecksumAddress
 from web3 import Web3
-from web3.types import RPCEndpoint
 
 if TYPE_CHECKING:
     from web3 import Web3 as Web3Type
@@ -20,13 +22,41 @@ SAFE_PROXY_FACTORY_ADDRESS: ChecksumAddress = Web3.to_checksum_address(
 # Bytecodes directory
 BYTECODES_DIR = Path(__file__).parent / "bytecodes"
 
+RPC_URL = "http://127.0.0.1:8545"
 
-def load_bytecode(filename: str) -> str:
-    """Load bytecode from a file in the bytecodes directory."""
+
+@functools.cache
+def load_bytecode(filename: str) -> bytes:
+    """Load and decode bytecode from a file in the bytecodes directory."""
     filepath = BYTECODES_DIR / filename
     if not filepath.exists():
         raise FileNotFoundError(f"Bytecode file not found: {filepath}")
-    return filepath.read_text().strip()
+    return bytes.fromhex(filepath.read_text().strip().removeprefix("0x"))
+
+
+def rpc_batch(calls: list[tuple[str, list[Any]]]) -> list[Any]:
+    """Send several JSON-RPC calls in a single HTTP request."""
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    response = requests.post(RPC_URL, json=payload, timeout=30)
+    response.raise_for_status()
+
+    body = response.json()
+    if not isinstance(body, list):
+        # Nodes that reject batches answer with a single error object
+        error = body.get("error", body) if isinstance(body, dict) else body
+        raise RuntimeError(f"JSON-RPC batch rejected: {error}")
+
+    replies = {reply.get("id"): reply for reply in body if isinstance(reply, dict)}
+    errors = [reply["error"] for reply in replies.values() if "error" in reply]
+    if errors:
+        raise RuntimeError(f"JSON-RPC batch failed: {errors}")
+    missing = [i for i in range(len(calls)) if "result" not in replies.get(i, {})]
+    if missing:
+        raise RuntimeError(f"JSON-RPC batch returned no result for calls {missing}")
+    return [replies[i]["result"] for i in range(len(calls))]
 
 
 def wait_for_node(w3: "Web3Type", attempts: int = 10, delay: int = 1) -> bool:
@@ -39,7 +69,7 @@ def wait_for_node(w3: "Web3Type", attempts: int = 10, delay: int = 1) -> bool:
 
 def deploy_contracts() -> None:
     print("Connecting to Anvil node...")
-    w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+    w3 = Web3(Web3.HTTPProvider(RPC_URL))
 
     if not wait_for_node(w3):
         print("Error: Could not connect to Anvil node.")
@@ -48,39 +78,50 @@ def deploy_contracts() -> None:
     print("Connected. Deploying contracts via anvil_setCode...")
 
     # Load bytecodes from files
-    proxy_factory_bytecode = load_bytecode("proxy_factory.txt")
-    safe_singleton_bytecode = load_bytecode("safe_singleton.txt")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        proxy_factory_bytecode, safe_singleton_bytecode = executor.map(
+            load_bytecode, ["proxy_factory.txt", "safe_singleton.txt"]
+        )
 
-    # Deploy Proxy Factory
+    # Deploy Proxy Factory and Safe Singleton in one round-trip
     print(f"Setting code for Proxy Factory at {SAFE_PROXY_FACTORY_ADDRESS}")
-    success = w3.provider.make_request(
-        RPCEndpoint("anvil_setCode"),
-        [SAFE_PROXY_FACTORY_ADDRESS, proxy_factory_bytecode],
-    )
-    if not success:
-        print("Failed to set code for Proxy Factory")
-        exit(1)
-
-    # Deploy Safe Singleton
     print(f"Setting code for Safe Singleton at {SAFE_SINGLETON_ADDRESS}")
-    success = w3.provider.make_request(
-        RPCEndpoint("anvil_setCode"),
-        [SAFE_SINGLETON_ADDRESS, safe_singleton_bytecode],
-    )
-    if not success:
-        print("Failed to set code for Safe Singleton")
+    try:
+        rpc_batch(
+            [
+                (
+                    "anvil_setCode",
+                    [SAFE_PROXY_FACTORY_ADDRESS, "0x" + proxy_factory_bytecode.hex()],
+                ),
+                (
+                    "anvil_setCode",
+                    [SAFE_SINGLETON_ADDRESS, "0x" + safe_singleton_bytecode.hex()],
+                ),
+            ]
+        )
+    except (requests.RequestException, RuntimeError) as e:
+        print(f"Failed to set contract code: {e}")
         exit(1)
 
     # Verify
-    code_factory = w3.eth.get_code(SAFE_PROXY_FACTORY_ADDRESS)
-    code_singleton = w3.eth.get_code(SAFE_SINGLETON_ADDRESS)
+    try:
+        code_factory, code_singleton = rpc_batch(
+            [
+                ("eth_getCode", [SAFE_PROXY_FACTORY_ADDRESS, "latest"]),
+                ("eth_getCode", [SAFE_SINGLETON_ADDRESS, "latest"]),
+            ]
+        )
+    except (requests.RequestException, RuntimeError) as e:
+        print(f"Failed to read back contract code: {e}")
+        exit(1)
 
+    # Codes are hex strings, "0x" meaning no code
     if len(code_factory) > 2 and len(code_singleton) > 2:
         print("Contracts successfully deployed!")
     else:
         print("Error: Contract deployment failed verification.")
-        print(f"Factory Code Length: {len(code_factory)}")
-        print(f"Singleton Code Length: {len(code_singleton)}")
+        print(f"Factory Code Length: {(len(code_factory) - 2) // 2}")
+        print(f"Singleton Code Length: {(len(code_singleton) - 2) // 2}")
         exit(1)
 
 
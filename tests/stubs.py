@@ -0,0 +1,53 @@
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+
+class StubAdapter:
+    """
+    Lightweight stand-in for Web3Adapter.
+
+    Only the methods passed to the constructor exist; touching any other
+    adapter method raises AttributeError, like a spec'd mock would.
+    """
+
+    __slots__ = (
+        "get_balance",
+        "get_chain_id",
+        "get_contract",
+        "get_safe_contract",
+        "get_signer_address",
+        "get_storage_at",
+        "is_contract",
+        "sign_message",
+        "to_checksum_address",
+        "wait_for_transaction_receipt",
+    )
+
+    def __init__(self, **methods: Any):
+        for name, method in methods.items():
+            setattr(self, name, method)
+
+
+class FakeTransport(HTTPAdapter):
+    """
+    Transport adapter that answers from a fixed route table.
+
+    Routes map (method, full URL) to a JSON body; anything else gets a 404.
+    Requests never reach the network and nothing is recorded.
+    """
+
+    def __init__(self, routes: dict[tuple[str, str], bytes]):
+        super().__init__()
+        self.routes = routes
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        body = self.routes.get((str(request.method), str(request.url)))
+        response = Response()
+        response.status_code = 404 if body is None else 200
+        response._content = body or b""
+        response.headers["Content-Type"] = "application/json"
+        response.url = str(request.url)
+        response.request = request
+        return response
@@ -0,0 +1,14 @@
+from unittest.mock import MagicMock, PropertyMock
+
+from safe_kit.adapter import Web3Adapter
+
+
+def test_get_chain_id_is_cached():
+    web3 = MagicMock()
+    chain_id = PropertyMock(return_value=100)
+    type(web3.eth).chain_id = chain_id
+    adapter = Web3Adapter(web3)
+
+    assert adapter.get_chain_id() == 100
+    assert adapter.get_chain_id() == 100
+    chain_id.assert_called_once()
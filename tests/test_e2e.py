@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from eth_account import Account
 from web3 import Web3
@@ -67,9 +69,14 @@ def test_full_safe_lifecycle(web3, adapter):
     # Note: In a real test we might want to wait for receipt, but Anvil is instant
     safe = factory.deploy_safe(safe_config, salt_nonce=salt_nonce)
 
+    # Independent reads: issue the RPC calls concurrently
+    with ThreadPoolExecutor() as executor:
+        threshold = executor.submit(safe.get_threshold)
+        owners = executor.submit(safe.get_owners)
+
     assert safe.get_address() == predicted_address
-    assert safe.get_threshold() == 1
-    assert safe.get_owners() == [owner_account.address]
+    assert threshold.result() == 1
+    assert owners.result() == [owner_account.address]
     print(f"Safe Deployed at: {safe.get_address()}")
 
     # 3. Fund the Safe
@@ -103,8 +110,11 @@ def test_full_safe_lifecycle(web3, adapter):
     print(f"Execution Tx Hash: {tx_hash}")
 
     # 7. Verify Result
-    final_balance = safe.get_balance()
-    recipient_balance = web3.eth.get_balance(recipient)
+    with ThreadPoolExecutor() as executor:
+        final_balance_future = executor.submit(safe.get_balance)
+        recipient_balance_future = executor.submit(web3.eth.get_balance, recipient)
+    final_balance = final_balance_future.result()
+    recipient_balance = recipient_balance_future.result()
 
     print(f"Safe Final Balance: {web3.from_wei(final_balance, 'ether')} ETH")
 
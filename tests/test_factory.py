@@ -1,36 +1,38 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
-from safe_kit.adapter import Web3Adapter
 from safe_kit.factory import SafeFactory
 from safe_kit.types import SafeAccountConfig
+from tests.stubs import StubAdapter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_adapter():
-    adapter = MagicMock(spec=Web3Adapter)
-    adapter.get_signer_address.return_value = "0xSigner"
-    adapter.to_checksum_address.side_effect = lambda x: x
-    adapter.is_contract.return_value = True
-    return adapter
+    return StubAdapter(
+        get_signer_address=Mock(return_value="0xSigner"),
+        to_checksum_address=lambda x: x,
+        is_contract=Mock(return_value=True),
+        get_contract=Mock(),
+        get_safe_contract=Mock(),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_proxy_factory(mock_adapter):
-    contract = MagicMock()
+    contract = Mock()
     mock_adapter.get_contract.return_value = contract
     return contract
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_safe_singleton(mock_adapter):
-    contract = MagicMock()
+    contract = Mock()
     mock_adapter.get_safe_contract.return_value = contract
     return contract
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def factory(mock_adapter, mock_proxy_factory, mock_safe_singleton):
     return SafeFactory(
         eth_adapter=mock_adapter,
@@ -39,6 +41,13 @@ def factory(mock_adapter, mock_proxy_factory, mock_safe_singleton):
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_contracts(mock_proxy_factory, mock_safe_singleton):
+    yield
+    mock_proxy_factory.reset_mock(return_value=True)
+    mock_safe_singleton.reset_mock(return_value=True)
+
+
 def test_predict_safe_address(factory, mock_proxy_factory, mock_safe_singleton):
     mock_safe_singleton.encodeABI.return_value = b"initializer"
     mock_proxy_factory.functions.createProxyWithNonce.return_value.call.return_value = (
@@ -1,25 +1,36 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 from hexbytes import HexBytes
 
-from safe_kit.adapter import Web3Adapter
 from safe_kit.safe import Safe
+from tests.stubs import StubAdapter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_adapter():
-    adapter = MagicMock(spec=Web3Adapter)
-    adapter.to_checksum_address.side_effect = lambda x: x
-    return adapter
+    return StubAdapter(
+        to_checksum_address=lambda x: x,
+        is_contract=Mock(return_value=True),
+        get_safe_contract=Mock(),
+        sign_message=Mock(),
+        wait_for_transaction_receipt=Mock(),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def safe(mock_adapter):
-    mock_adapter.is_contract.return_value = True
     return Safe(mock_adapter, "0xSafeAddress")
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_adapter, safe):
+    yield
+    mock_adapter.sign_message.reset_mock(return_value=True)
+    mock_adapter.wait_for_transaction_receipt.reset_mock(return_value=True)
+    safe.contract.reset_mock(return_value=True)
+
+
 def test_get_message_hash(safe):
     message = "Hello World"
     # Expected hash for "Hello World"
@@ -35,12 +46,12 @@ def test_get_message_hash(safe):
     assert safe.get_message_hash(message) == expected_hash
 
 
-def test_sign_message(safe):
+def test_sign_message(safe, monkeypatch):
     message = "Hello World"
     message_hash = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
     signature = "0xabcdef1234567890"
 
-    safe.get_message_hash = MagicMock(return_value=message_hash)
+    monkeypatch.setattr(safe, "get_message_hash", Mock(return_value=message_hash))
     safe.eth_adapter.sign_message.return_value = signature
 
     assert safe.sign_message(message) == signature
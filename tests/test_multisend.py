@@ -1,3 +1,5 @@
+import pytest
+
 from safe_kit.multisend import MultiSend
 from safe_kit.types import SafeTransactionData
 
@@ -32,3 +34,30 @@ def test_encode_transactions():
 
     # Check operation of tx2 (index 85)
     assert encoded[85] == 1
+
+
+def test_encode_transactions_layout():
+    tx = SafeTransactionData(
+        to="0x1234567890123456789012345678901234567890",
+        value=100,
+        data="0xabcdef",
+        operation=1,
+    )
+
+    encoded = MultiSend.encode_transactions([tx])
+
+    assert tx.multisend_encoded_len == len(encoded) == 88
+    assert encoded == (
+        b"\x01"
+        + bytes.fromhex("1234567890123456789012345678901234567890")
+        + (100).to_bytes(32, "big")
+        + (3).to_bytes(32, "big")
+        + bytes.fromhex("abcdef")
+    )
+
+
+def test_encode_transactions_invalid_address():
+    tx = SafeTransactionData(to="0x1234", value=0, data="0x")
+
+    with pytest.raises(ValueError, match="Invalid address length for 0x1234"):
+        MultiSend.encode_transactions([tx])
@@ -1,224 +1,290 @@
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, Mock, call
 
 import pytest
+from eth_abi.abi import encode
+from web3.exceptions import ContractLogicError
 
-from safe_kit.adapter import Web3Adapter
-from safe_kit.safe import Safe
-from safe_kit.types import SafeTransactionData
+from safe_kit.abis import MULTICALL3_ABI
+from safe_kit.managers.guard_manager import (
+    FALLBACK_HANDLER_STORAGE_SLOT,
+    GUARD_STORAGE_SLOT,
+)
+from safe_kit.managers.module_manager import MODULES_PAGE_SIZE
+from safe_kit.safe import MULTICALL3_ADDRESS, Safe
+from safe_kit.types import SENTINEL_ADDRESS, SafeTransactionData
+from tests.stubs import StubAdapter
 
+OWNERS = ["0xOwner1", "0xOwner2"]
+# Raw hashes returned by the mocked contract and their hex encodings
+HASH = b"hash"
+HASH_HEX = HASH.hex()
+TX_HASH = b"tx_hash"
+TX_HASH_HEX = TX_HASH.hex()
+# Placeholder transaction; tests take a model_copy since Safe may set its nonce
+BASE_TX_DATA = SafeTransactionData(to="0xTo", value=0, data="0x", operation=0, nonce=0)
 
-@pytest.fixture
-def mock_adapter():
-    adapter = MagicMock(spec=Web3Adapter)
-    adapter.get_balance.return_value = 1000
-    adapter.get_chain_id.return_value = 1
-    adapter.get_signer_address.return_value = "0xSigner"
-    adapter.to_checksum_address.side_effect = lambda x: x
-    adapter.is_contract.return_value = True
-    return adapter
 
+class FakeFn:
+    """
+    Stand-in for a contract function whose call() returns `result`.
 
-@pytest.fixture
+    Calling it with any arguments returns itself, mirroring how web3 binds
+    arguments before call(), without MagicMock's call bookkeeping.
+    """
+
+    __slots__ = ("result",)
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "FakeFn":
+        return self
+
+    def call(self) -> Any:
+        return self.result
+
+
+MODULES_PAGE_1 = FakeFn((["0xMod1"], "0xMod1"))
+MODULES_PAGE_2 = FakeFn((["0xMod2"], SENTINEL_ADDRESS))
+MODULES_SINGLE_PAGE = FakeFn((["0xMod1", "0xMod2"], SENTINEL_ADDRESS))
+
+
+def configure_contract(contract: MagicMock) -> None:
+    functions = contract.functions
+    functions.nonce = FakeFn(5)
+    functions.getThreshold = FakeFn(2)
+    functions.getOwners = FakeFn(OWNERS)
+    functions.VERSION = FakeFn("1.3.0")
+    functions.isOwner = lambda owner: FakeFn(owner in OWNERS)
+
+
+@pytest.fixture(scope="module")
 def mock_contract():
     contract = MagicMock()
-    contract.functions.nonce().call.return_value = 5
-    contract.functions.getThreshold().call.return_value = 2
-    contract.functions.getOwners().call.return_value = ["0xOwner1", "0xOwner2"]
-    contract.functions.VERSION().call.return_value = "1.3.0"
-    contract.functions.isOwner.side_effect = lambda owner: MagicMock(
-        call=MagicMock(return_value=owner in ["0xOwner1", "0xOwner2"])
-    )
+    configure_contract(contract)
     return contract
 
 
-@pytest.fixture
-def safe(mock_adapter, mock_contract):
-    mock_adapter.get_safe_contract.return_value = mock_contract
+@pytest.fixture(scope="module")
+def mock_adapter(mock_contract):
+    # Plain callables for pure lookups, Mocks only where calls are asserted
+    return StubAdapter(
+        get_chain_id=lambda: 1,
+        get_signer_address=lambda: "0xSigner",
+        to_checksum_address=lambda x: x,
+        is_contract=lambda address: True,
+        get_safe_contract=lambda address: mock_contract,
+        get_balance=Mock(return_value=1000),
+        get_contract=Mock(),
+        get_storage_at=Mock(),
+        sign_message=Mock(),
+        wait_for_transaction_receipt=Mock(),
+    )
+
+
+@pytest.fixture(scope="module")
+def safe(mock_adapter):
     return Safe(eth_adapter=mock_adapter, safe_address="0xSafeAddress")
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(safe, mock_adapter, mock_contract):
+    yield
+    mock_adapter.get_balance.reset_mock()
+    mock_adapter.get_contract.reset_mock(return_value=True)
+    mock_adapter.get_storage_at.reset_mock(return_value=True, side_effect=True)
+    mock_adapter.sign_message.reset_mock(return_value=True)
+    mock_adapter.wait_for_transaction_receipt.reset_mock(return_value=True)
+    mock_contract.reset_mock(return_value=True, side_effect=True)
+    configure_contract(mock_contract)
+
+
 def test_safe_initialization(safe):
     assert safe.get_address() == "0xSafeAddress"
 
 
-def test_safe_initialization_chain_id_match(mock_adapter, mock_contract):
+def test_safe_initialization_chain_id_match(mock_adapter):
     # Adapter defaults to chain_id=1
-    mock_adapter.get_safe_contract.return_value = mock_contract
     safe = Safe(eth_adapter=mock_adapter, safe_address="0xSafeAddress", chain_id=1)
     assert safe.chain_id == 1
 
 
-def test_safe_initialization_chain_id_mismatch(mock_adapter, mock_contract):
+def test_safe_initialization_chain_id_mismatch(mock_adapter):
     # Adapter defaults to chain_id=1
-    mock_adapter.get_safe_contract.return_value = mock_contract
-    expected_msg = r"Adapter chain ID \(1\) does not match Safe chain ID \(2\)"
-    with pytest.raises(ValueError, match=expected_msg):
+    with pytest.raises(ValueError) as exc_info:
         Safe(eth_adapter=mock_adapter, safe_address="0xSafeAddress", chain_id=2)
 
+    assert str(exc_info.value) == (
+        "Adapter chain ID (1) does not match Safe chain ID (2)"
+    )
+
 
 def test_get_balance(safe, mock_adapter):
     assert safe.get_balance() == 1000
     mock_adapter.get_balance.assert_called_with("0xSafeAddress")
 
 
-def test_get_nonce(safe, mock_contract):
+def test_get_nonce(safe):
     assert safe.get_nonce() == 5
-    mock_contract.functions.nonce().call.assert_called_once()
 
 
-def test_get_threshold(safe, mock_contract):
+def test_get_threshold(safe):
     assert safe.get_threshold() == 2
-    mock_contract.functions.getThreshold().call.assert_called_once()
 
 
-def test_get_owners(safe, mock_contract):
+def test_get_owners(safe):
     owners = safe.get_owners()
     assert len(owners) == 2
     assert "0xOwner1" in owners
-    mock_contract.functions.getOwners().call.assert_called_once()
 
 
-def test_create_add_owner_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xaddOwnerData"
+@pytest.mark.parametrize(
+    ("method", "args", "fn_name", "fn_args"),
+    [
+        (
+            "create_add_owner_transaction",
+            ("0xNewOwner", 2),
+            "addOwnerWithThreshold",
+            ["0xNewOwner", 2],
+        ),
+        (
+            "create_swap_owner_transaction",
+            ("0xOwner2", "0xNewOwner"),
+            "swapOwner",
+            ["0xOwner1", "0xOwner2", "0xNewOwner"],
+        ),
+        ("create_change_threshold_transaction", (3,), "changeThreshold", [3]),
+        ("create_enable_module_transaction", ("0xMod1",), "enableModule", ["0xMod1"]),
+        ("create_set_guard_transaction", ("0xGuard",), "setGuard", ["0xGuard"]),
+        (
+            "create_set_fallback_handler_transaction",
+            ("0xHandler",),
+            "setFallbackHandler",
+            ["0xHandler"],
+        ),
+    ],
+)
+def test_create_self_call_transaction(
+    safe, mock_contract, method, args, fn_name, fn_args
+):
+    mock_contract.encodeABI.return_value = "0xencodedData"
 
-    tx = safe.create_add_owner_transaction("0xNewOwner", 2)
+    tx = getattr(safe, method)(*args)
 
     assert tx.data.to == "0xSafeAddress"
-    assert tx.data.data == "0xaddOwnerData"
+    assert tx.data.data == "0xencodedData"
     assert tx.data.value == 0
     assert tx.data.operation == 0
-    mock_contract.encodeABI.assert_called_with(
-        fn_name="addOwnerWithThreshold", args=["0xNewOwner", 2]
-    )
-
-
-def test_create_remove_owner_transaction(safe, mock_contract):
+    mock_contract.encodeABI.assert_called_with(fn_name=fn_name, args=fn_args)
+
+
+@pytest.mark.parametrize(
+    ("owner", "prev_owner"),
+    [
+        ("0xOwner2", "0xOwner1"),
+        # The first owner is preceded by the sentinel
+        ("0xOwner1", SENTINEL_ADDRESS),
+    ],
+)
+def test_create_remove_owner_transaction(safe, mock_contract, owner, prev_owner):
     mock_contract.encodeABI.return_value = "0xremoveOwnerData"
-    # Owners are ["0xOwner1", "0xOwner2"]
-    # Removing "0xOwner2", prev should be "0xOwner1"
 
-    tx = safe.create_remove_owner_transaction("0xOwner2", 1)
+    tx = safe.create_remove_owner_transaction(owner, 1)
 
     assert tx.data.to == "0xSafeAddress"
     assert tx.data.data == "0xremoveOwnerData"
     mock_contract.encodeABI.assert_called_with(
-        fn_name="removeOwner", args=["0xOwner1", "0xOwner2", 1]
-    )
-
-
-def test_create_remove_owner_transaction_first_owner(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xremoveOwnerData"
-    # Owners are ["0xOwner1", "0xOwner2"]
-    # Removing "0xOwner1", prev should be Sentinel
-
-    safe.create_remove_owner_transaction("0xOwner1", 1)
-
-    mock_contract.encodeABI.assert_called_with(
-        fn_name="removeOwner",
-        args=["0x0000000000000000000000000000000000000001", "0xOwner1", 1],
+        fn_name="removeOwner", args=[prev_owner, owner, 1]
     )
 
 
-def test_create_swap_owner_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xswapOwnerData"
-
-    safe.create_swap_owner_transaction("0xOwner2", "0xNewOwner")
+def test_owner_changes_reuse_given_owners(safe, mock_contract, monkeypatch):
+    get_owners = Mock(return_value=FakeFn(OWNERS))
+    monkeypatch.setattr(mock_contract.functions, "getOwners", get_owners)
+    mock_contract.encodeABI.return_value = "0x"
 
+    owners = safe.get_owners()
+    safe.create_remove_owner_transaction("0xOwner2", 1, owners=owners)
+    safe.create_swap_owner_transaction("0xOwner2", "0xNewOwner", owners=owners)
+    assert get_owners.call_count == 1
     mock_contract.encodeABI.assert_called_with(
         fn_name="swapOwner", args=["0xOwner1", "0xOwner2", "0xNewOwner"]
     )
 
+    # Without them every builder reads the current owners
+    safe.create_remove_owner_transaction("0xOwner2", 1)
+    assert get_owners.call_count == 2
+
 
 def test_get_transaction_hash(safe, mock_contract):
-    mock_contract.functions.getTransactionHash.return_value.call.return_value = b"hash"
+    mock_contract.functions.getTransactionHash.return_value.call.return_value = HASH
 
     tx = safe.create_native_transfer_transaction("0xReceiver", 100)
     tx_hash = safe.get_transaction_hash(tx)
 
-    assert tx_hash == "68617368"  # hex of b"hash"
-    mock_contract.functions.getTransactionHash.assert_called_once()
+    assert tx_hash == HASH_HEX
 
 
 def test_approve_hash(safe, mock_contract, mock_adapter):
-    mock_contract.functions.approveHash.return_value.transact.return_value = b"tx_hash"
+    mock_contract.functions.approveHash.return_value.transact.return_value = TX_HASH
 
     # Use a valid hex string
     tx_hash = safe.approve_hash(
         "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
     )
 
-    assert tx_hash == "74785f68617368"  # hex of b"tx_hash"
-    mock_contract.functions.approveHash.assert_called_once()
+    assert tx_hash == TX_HASH_HEX
 
 
 def test_sign_transaction_eth_sign(safe, mock_adapter, mock_contract):
-    mock_contract.functions.getTransactionHash.return_value.call.return_value = b"hash"
+    mock_contract.functions.getTransactionHash.return_value.call.return_value = HASH
     # Mock signature: r(32) + s(32) + v(1)
     # v=27 (0x1b) -> +4 -> 31 (0x1f)
-    mock_signature = b"\x00" * 64 + b"\x1b"
-    mock_adapter.sign_message.return_value = mock_signature
+    signature = bytearray(65)
+    signature[64] = 0x1B
+    mock_adapter.sign_message.return_value = bytes(signature)
 
     tx = safe.create_native_transfer_transaction("0xReceiver", 100)
     signed_tx = safe.sign_transaction(tx, method="eth_sign")
 
-    expected_signature = (b"\x00" * 64 + b"\x1f").hex()
-    assert signed_tx.signatures["0xSigner"] == expected_signature
-    mock_adapter.sign_message.assert_called_with("68617368")
-
+    assert signed_tx.signatures["0xSigner"] == "00" * 64 + "1f"
+    mock_adapter.sign_message.assert_called_with(HASH_HEX)
 
-def test_create_change_threshold_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xchangeThresholdData"
 
-    safe.create_change_threshold_transaction(3)
-
-    mock_contract.encodeABI.assert_called_with(fn_name="changeThreshold", args=[3])
-
-
-def test_get_modules(safe, mock_contract):
-    # Mock pagination: first call returns [mod1], next=mod1;
-    # second call returns [mod2], next=sentinel
-    mock_contract.functions.getModulesPaginated.side_effect = [
-        MagicMock(call=MagicMock(return_value=(["0xMod1"], "0xMod1"))),
-        MagicMock(
-            call=MagicMock(
-                return_value=(["0xMod2"], "0x0000000000000000000000000000000000000001")
-            )
-        ),
-    ]
+@pytest.mark.parametrize(
+    ("pages", "starts"),
+    [
+        # Typical case: every module fits in the first page
+        ([MODULES_SINGLE_PAGE], [SENTINEL_ADDRESS]),
+        # First page returns [mod1] and next=mod1, second ends at the sentinel
+        ([MODULES_PAGE_1, MODULES_PAGE_2], [SENTINEL_ADDRESS, "0xMod1"]),
+    ],
+)
+def test_get_modules(safe, mock_contract, pages, starts):
+    get_modules_paginated = mock_contract.functions.getModulesPaginated
+    get_modules_paginated.side_effect = pages
 
     modules = safe.get_modules()
 
     assert modules == ["0xMod1", "0xMod2"]
-    assert mock_contract.functions.getModulesPaginated.call_count == 2
+    assert get_modules_paginated.call_args_list == [
+        call(start, 1000) for start in starts
+    ]
 
 
 def test_is_module_enabled(safe, mock_contract):
-    mock_contract.functions.isModuleEnabled("0xMod1").call.return_value = True
-    assert safe.is_module_enabled("0xMod1") is True
-
-
-def test_create_enable_module_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xenableModuleData"
+    is_module_enabled = mock_contract.functions.isModuleEnabled
+    is_module_enabled.return_value.call.return_value = True
 
-    tx = safe.create_enable_module_transaction("0xMod1")
-
-    assert tx.data.data == "0xenableModuleData"
-    mock_contract.encodeABI.assert_called_with(fn_name="enableModule", args=["0xMod1"])
+    assert safe.is_module_enabled("0xMod1") is True
+    is_module_enabled.assert_called_once_with("0xMod1")
 
 
 def test_create_disable_module_transaction(safe, mock_contract):
     # Mock get_modules to return ["0xMod1", "0xMod2"]
     # We want to disable "0xMod2", so prev should be "0xMod1"
-    mock_contract.functions.getModulesPaginated.side_effect = [
-        MagicMock(
-            call=MagicMock(
-                return_value=(
-                    ["0xMod1", "0xMod2"],
-                    "0x0000000000000000000000000000000000000001",
-                )
-            )
-        )
-    ]
+    mock_contract.functions.getModulesPaginated.side_effect = [MODULES_SINGLE_PAGE]
     mock_contract.encodeABI.return_value = "0xdisableModuleData"
 
     tx = safe.create_disable_module_transaction("0xMod2")
@@ -283,11 +349,10 @@ def test_estimate_transaction_gas(safe, mock_contract):
     gas = safe.estimate_transaction_gas(tx)
 
     assert gas == 50000
-    mock_contract.functions.requiredTxGas.assert_called_once()
 
 
 def test_check_signatures(safe, mock_contract):
-    mock_contract.functions.getTransactionHash.return_value.call.return_value = b"hash"
+    mock_contract.functions.getTransactionHash.return_value.call.return_value = HASH
 
     tx = safe.create_native_transfer_transaction("0xReceiver", 100)
     # Should not raise
@@ -309,15 +374,6 @@ def test_get_guard(safe, mock_adapter):
     )
 
 
-def test_create_set_guard_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xsetGuardData"
-
-    tx = safe.create_set_guard_transaction("0xGuard")
-
-    assert tx.data.data == "0xsetGuardData"
-    mock_contract.encodeABI.assert_called_with(fn_name="setGuard", args=["0xGuard"])
-
-
 def test_get_fallback_handler(safe, mock_adapter):
     # Mock storage return value (padded address)
     mock_adapter.get_storage_at.return_value = b"\x00" * 12 + b"\x34" * 20
@@ -331,21 +387,113 @@ def test_get_fallback_handler(safe, mock_adapter):
     )
 
 
-def test_create_set_fallback_handler_transaction(safe, mock_contract):
-    mock_contract.encodeABI.return_value = "0xsetFallbackHandlerData"
+def encode_state_bundle(
+    owners: list[str], modules: list[str], next_module: str
+) -> list[tuple[bool, bytes]]:
+    # aggregate3 results in the order get_state_bundle issues its calls
+    return_data = [
+        encode(["uint256"], [5]),
+        encode(["uint256"], [2]),
+        encode(["address[]"], [owners]),
+        encode(["address[]", "address"], [modules, next_module]),
+        encode(["bytes"], [b"\x00" * 12 + b"\x12" * 20]),
+        encode(["bytes"], [b"\x00" * 12 + b"\x34" * 20]),
+    ]
+    return [(True, data) for data in return_data]
 
-    tx = safe.create_set_fallback_handler_transaction("0xHandler")
 
-    assert tx.data.data == "0xsetFallbackHandlerData"
-    mock_contract.encodeABI.assert_called_with(
-        fn_name="setFallbackHandler", args=["0xHandler"]
+def test_get_state_bundle(safe, mock_adapter, mock_contract):
+    owners = ["0x" + "01" * 20, "0x" + "02" * 20]
+    modules = ["0x" + "03" * 20]
+    mock_contract.encodeABI.side_effect = lambda fn_name, args: f"{fn_name}{args}"
+    aggregate3 = mock_adapter.get_contract.return_value.functions.aggregate3
+    aggregate3.return_value.call.return_value = encode_state_bundle(
+        owners, modules, SENTINEL_ADDRESS
     )
 
+    state = safe.get_state_bundle()
+
+    assert state.nonce == 5
+    assert state.threshold == 2
+    assert state.owners == owners
+    assert state.modules == modules
+    assert state.guard == "0x" + "12" * 20
+    assert state.fallback_handler == "0x" + "34" * 20
+    mock_adapter.get_contract.assert_called_once_with(
+        MULTICALL3_ADDRESS, MULTICALL3_ABI
+    )
+    # Encoded in the same order the results are decoded
+    encoded = [
+        ("nonce", []),
+        ("getThreshold", []),
+        ("getOwners", []),
+        ("getModulesPaginated", [SENTINEL_ADDRESS, MODULES_PAGE_SIZE]),
+        ("getStorageAt", [GUARD_STORAGE_SLOT, 1]),
+        ("getStorageAt", [FALLBACK_HANDLER_STORAGE_SLOT, 1]),
+    ]
+    assert mock_contract.encodeABI.call_args_list == [
+        call(fn_name=fn_name, args=args) for fn_name, args in encoded
+    ]
+    aggregate3.assert_called_once_with(
+        [("0xSafeAddress", False, f"{fn_name}{args}") for fn_name, args in encoded]
+    )
+    mock_adapter.get_storage_at.assert_not_called()
+
+
+def test_get_state_bundle_with_more_modules(
+    safe, mock_adapter, mock_contract, monkeypatch
+):
+    mock_contract.encodeABI.return_value = "0x"
+    aggregate3 = mock_adapter.get_contract.return_value.functions.aggregate3
+    aggregate3.return_value.call.return_value = encode_state_bundle(
+        ["0x" + "01" * 20], ["0x" + "03" * 20], "0x" + "03" * 20
+    )
+    pages = {
+        SENTINEL_ADDRESS: (["0xMod1"], "0xMod1"),
+        "0xMod1": (["0xMod2"], SENTINEL_ADDRESS),
+    }
+    monkeypatch.setattr(
+        mock_contract.functions,
+        "getModulesPaginated",
+        lambda start, page_size: FakeFn(pages[start]),
+    )
+
+    state = safe.get_state_bundle()
+
+    # The first page did not end the list, so all modules are read again
+    assert state.modules == ["0xMod1", "0xMod2"]
+
+
+def test_get_state_bundle_without_multicall(
+    safe, mock_adapter, mock_contract, monkeypatch
+):
+    aggregate3 = mock_adapter.get_contract.return_value.functions.aggregate3
+    aggregate3.return_value.call.side_effect = ContractLogicError("execution reverted")
+    storage = {
+        0x4A204F620C8C5CCDCA3FD54D003B6D13435454A733A569F8E4A6426EA62BF7A0: b"\x12",
+        0x6C9A6C4A39284E37ED1CF53D337577D14212A4870FB976A4366C693B939918D5: b"\x34",
+    }
+    mock_adapter.get_storage_at.side_effect = (
+        lambda address, slot: b"\x00" * 12 + storage[slot] * 20
+    )
+    monkeypatch.setattr(
+        mock_contract.functions,
+        "getModulesPaginated",
+        FakeFn((["0xMod1"], SENTINEL_ADDRESS)),
+    )
+
+    state = safe.get_state_bundle()
+
+    assert state.nonce == 5
+    assert state.threshold == 2
+    assert state.owners == ["0xOwner1", "0xOwner2"]
+    assert state.modules == ["0xMod1"]
+    assert state.guard == "0x" + "12" * 20
+    assert state.fallback_handler == "0x" + "34" * 20
+
 
 def test_sign_transaction_eth_sign_manual(safe, mock_adapter, mock_contract):
-    # Mock transaction data
-    tx_data = SafeTransactionData(to="0xTo", value=0, data="0x", operation=0, nonce=0)
-    safe_tx = safe.create_transaction(tx_data)
+    safe_tx = safe.create_transaction(BASE_TX_DATA.model_copy())
 
     # Mock getTransactionHash
     # Return bytes directly as web3.py call() would return bytes for bytes32
@@ -385,7 +533,6 @@ def test_simulate_transaction_success(safe, mock_contract):
 
     result = safe.simulate_transaction(tx)
     assert result is True
-    mock_contract.functions.execTransaction.assert_called_once()
 
 
 def test_simulate_transaction_failure(safe, mock_contract):
@@ -407,18 +554,18 @@ def test_simulate_transaction_exception(safe, mock_contract):
 
 
 def test_execute_transaction_with_wait(safe, mock_contract, mock_adapter):
-    mock_contract.functions.execTransaction.return_value.transact.return_value = b"tx_hash"
+    mock_contract.functions.execTransaction.return_value.transact.return_value = TX_HASH
     tx = safe.create_native_transfer_transaction("0xReceiver", 100)
 
     safe.execute_transaction(tx, wait_for_receipt=True)
 
     mock_adapter.wait_for_transaction_receipt.assert_called_with(
-        "74785f68617368", timeout=120
+        TX_HASH_HEX, timeout=120
     )
 
 
 def test_execute_transaction_with_gas(safe, mock_contract):
-    mock_contract.functions.execTransaction.return_value.transact.return_value = b"tx_hash"
+    mock_contract.functions.execTransaction.return_value.transact.return_value = TX_HASH
     tx = safe.create_native_transfer_transaction("0xReceiver", 100)
 
     safe.execute_transaction(tx, gas=500000)
@@ -437,7 +584,6 @@ def test_estimate_safe_transaction_gas(safe, mock_contract):
     gas = safe.estimate_safe_transaction_gas(tx)
 
     assert gas == 100000
-    mock_contract.functions.execTransaction.return_value.estimate_gas.assert_called_once()
 
 
 def test_create_add_owner_transaction_already_owner(safe):
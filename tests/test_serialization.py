@@ -0,0 +1,45 @@
+import pytest
+
+from safe_kit.serialization import (
+    StdlibJsonBackend,
+    get_json_backend,
+    json_backend,
+)
+
+
+def test_stdlib_backend_round_trip():
+    backend = get_json_backend("json")
+    payload = {"to": "0xTo", "value": 10**20, "data": None}
+
+    assert isinstance(backend, StdlibJsonBackend)
+    assert backend.loads(backend.dumps(payload)) == payload
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend 'ujson'"):
+        get_json_backend("ujson")
+
+
+def test_default_backend_is_available():
+    assert json_backend.loads(b'{"safes": []}') == {"safes": []}
+
+
+def test_orjson_backend_encodes_large_integers():
+    pytest.importorskip("orjson")
+    backend = get_json_backend("orjson")
+
+    # Wei amounts routinely exceed the 64-bit range orjson supports natively
+    assert backend.loads(backend.dumps({"value": 10**20})) == {"value": 10**20}
+
+
+@pytest.mark.parametrize(
+    "value", [2**64 - 1, 10**20, 2**256 - 1, -(2**63), -9300000000000000000]
+)
+def test_orjson_backend_decodes_large_integers_exactly(value):
+    pytest.importorskip("orjson")
+    backend = get_json_backend("orjson")
+
+    decoded = backend.loads(b'{"balance": %d}' % value)["balance"]
+
+    assert type(decoded) is int
+    assert decoded == value
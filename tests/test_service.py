@@ -1,450 +1,512 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlencode
+
+import orjson
 import pytest
+import requests
 import requests_mock
-
-from safe_kit.service import SafeServiceClient
-from safe_kit.types import SafeTransactionData
-
-
-@pytest.fixture
-def service():
-    return SafeServiceClient("https://safe-transaction-mainnet.safe.global")
-
-
-def test_get_service_info(service):
-    with requests_mock.Mocker() as m:
-        m.get(
-            "https://safe-transaction-mainnet.safe.global/v1/about/",
-            json={
-                "name": "Safe Transaction Service",
-                "version": "1.0.0",
-                "api_version": "v1",
-                "secure": True,
-                "settings": {},
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+
+from safe_kit.errors import SafeServiceError
+from safe_kit.serialization import json_backend
+from safe_kit.service import MAX_CONCURRENT_REQUESTS, SafeServiceClient
+from safe_kit.types import DECODER_INCOMING, SafeTransactionData
+from tests.stubs import FakeTransport
+
+PENDING_TX: dict[str, Any] = {
+    "safe": "0xSafeAddress",
+    "to": "0xTo",
+    "value": "0",
+    "data": None,
+    "operation": 0,
+    "gasToken": "0x0000000000000000000000000000000000000000",
+    "safeTxGas": 0,
+    "baseGas": 0,
+    "gasPrice": "0",
+    "refundReceiver": "0x0000000000000000000000000000000000000000",
+    "nonce": 0,
+    "executionDate": None,
+    "submissionDate": "2023-01-01T00:00:00Z",
+    "modified": "2023-01-01T00:00:00Z",
+    "blockNumber": None,
+    "transactionHash": None,
+    "safeTxHash": "0xHash",
+    "executor": None,
+    "isExecuted": False,
+    "isSuccessful": None,
+    "ethGasPrice": None,
+    "maxFeePerGas": None,
+    "maxPriorityFeePerGas": None,
+    "gasUsed": None,
+    "fee": None,
+    "origin": None,
+    "dataDecoded": None,
+    "confirmationsRequired": 2,
+    "confirmations": [],
+    "trusted": True,
+    "signatures": None,
+}
+EXECUTED_TX: dict[str, Any] = {
+    **PENDING_TX,
+    "nonce": 1,
+    "executionDate": "2023-01-02T00:00:00Z",
+    "modified": "2023-01-02T00:00:00Z",
+    "blockNumber": 12345,
+    "transactionHash": "0xTxHash",
+    "executor": "0xExecutor",
+    "isExecuted": True,
+    "isSuccessful": True,
+    "ethGasPrice": "1000000000",
+    "maxFeePerGas": "1000000000",
+    "maxPriorityFeePerGas": "1000000000",
+    "gasUsed": 21000,
+    "fee": "21000000000000",
+}
+SAFE_INFO: dict[str, Any] = {
+    "address": "0xSafeAddress",
+    "nonce": 5,
+    "threshold": 2,
+    "owners": ["0xOwner1", "0xOwner2", "0xOwner3"],
+    "masterCopy": "0xMasterCopy",
+    "modules": ["0xModule1"],
+    "fallbackHandler": "0xFallbackHandler",
+    "guard": "0x0000000000000000000000000000000000000000",
+    "version": "1.3.0",
+}
+INCOMING_TX: dict[str, Any] = {
+    "executionDate": "2023-01-01T00:00:00Z",
+    "transactionHash": "0xTxHash",
+    "to": "0xSafe",
+    "value": "100",
+    "tokenAddress": None,
+    "from": "0xSender",
+}
+
+# Response bodies are serialized once at import with orjson instead of by
+# requests_mock on every request
+SERVICE_INFO_BODY = orjson.dumps(
+    {
+        "name": "Safe Transaction Service",
+        "version": "1.0.0",
+        "api_version": "v1",
+        "secure": True,
+        "settings": {},
+    }
+)
+PENDING_TX_BODY = orjson.dumps(PENDING_TX)
+PENDING_TXS_BODY = orjson.dumps({"results": [PENDING_TX]})
+EXECUTED_TXS_BODY = orjson.dumps({"results": [EXECUTED_TX]})
+SAFE_INFO_BODY = orjson.dumps(SAFE_INFO)
+SAFE_1_INFO_BODY = orjson.dumps({**SAFE_INFO, "address": "0xSafe1", "nonce": 0})
+SAFE_2_INFO_BODY = orjson.dumps({**SAFE_INFO, "address": "0xSafe2", "nonce": 1})
+INVALID_SAFE_INFO_BODY = orjson.dumps({"address": "0xBroken"})
+SAFES_BODY = orjson.dumps({"safes": ["0xSafe1", "0xSafe2"]})
+BALANCES_BODY = orjson.dumps(
+    [
+        {
+            "tokenAddress": None,
+            "token": None,
+            "balance": "1000000000000000000",
+        },
+        {
+            "tokenAddress": "0xToken",
+            "token": {"name": "Token", "symbol": "TKN", "decimals": 18},
+            "balance": "5000000000000000000",
+        },
+    ]
+)
+CREATION_INFO_BODY = orjson.dumps(
+    {
+        "created": "2023-01-01T00:00:00Z",
+        "creator": "0xCreator",
+        "transactionHash": "0xTxHash",
+        "factoryAddress": "0xFactory",
+        "masterCopy": "0xMasterCopy",
+        "setupData": "0xSetupData",
+    }
+)
+COLLECTIBLES_BODY = orjson.dumps(
+    [
+        {
+            "address": "0xNFTContract",
+            "tokenName": "Cool NFT",
+            "tokenSymbol": "CNFT",
+            "logoUri": "https://example.com/logo.png",
+            "id": "1",
+            "uri": "https://example.com/token/1",
+            "name": "Cool NFT #1",
+            "description": "A very cool NFT",
+            "imageUri": "https://example.com/image.png",
+            "metadata": {"trait": "rare"},
+        }
+    ]
+)
+DELEGATES_BODY = orjson.dumps(
+    {
+        "results": [
+            {
+                "safe": "0xSafeAddress",
+                "delegate": "0xDelegate",
+                "delegator": "0xDelegator",
+                "label": "My Delegate",
+            }
+        ]
+    }
+)
+TOKEN: dict[str, Any] = {
+    "address": "0xToken",
+    "name": "Token",
+    "symbol": "TKN",
+    "decimals": 18,
+    "logoUri": "https://example.com/logo.png",
+}
+TOKENS_BODY = orjson.dumps(
+    {
+        "results": [
+            {**TOKEN, "address": "0xToken1", "name": "Token 1", "symbol": "TKN1"},
+            {
+                "address": "0xToken2",
+                "name": "Token 2",
+                "symbol": "TKN2",
+                "decimals": 6,
+                "logoUri": None,
             },
-        )
-        info = service.get_service_info()
-        assert info.name == "Safe Transaction Service"
-
-
-def test_get_pending_transactions(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/multisig-transactions/?executed=false&trusted=true",
-            json={
-                "results": [
-                    {
-                        "safe": safe_address,
-                        "to": "0xTo",
-                        "value": "0",
-                        "data": None,
-                        "operation": 0,
-                        "gasToken": "0x0000000000000000000000000000000000000000",
-                        "safeTxGas": 0,
-                        "baseGas": 0,
-                        "gasPrice": "0",
-                        "refundReceiver": "0x0000000000000000000000000000000000000000",
-                        "nonce": 0,
-                        "executionDate": None,
-                        "submissionDate": "2023-01-01T00:00:00Z",
-                        "modified": "2023-01-01T00:00:00Z",
-                        "blockNumber": None,
-                        "transactionHash": None,
-                        "safeTxHash": "0xHash",
-                        "executor": None,
-                        "isExecuted": False,
-                        "isSuccessful": None,
-                        "ethGasPrice": None,
-                        "maxFeePerGas": None,
-                        "maxPriorityFeePerGas": None,
-                        "gasUsed": None,
-                        "fee": None,
-                        "origin": None,
-                        "dataDecoded": None,
-                        "confirmationsRequired": 2,
-                        "confirmations": [],
-                        "trusted": True,
-                        "signatures": None,
-                    }
-                ]
-            },
-        )
-        txs = service.get_pending_transactions(safe_address)
-        assert len(txs) == 1
-        assert txs[0].safe_tx_hash == "0xHash"
-
-
-def test_get_multisig_transactions(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
+        ]
+    }
+)
+TOKEN_BODY = orjson.dumps(TOKEN)
+DECODED_DATA_BODY = orjson.dumps(
+    {
+        "method": "transfer",
+        "parameters": [
+            {"name": "to", "type": "address", "value": "0xRecipient"},
+            {"name": "value", "type": "uint256", "value": "100"},
+        ],
+    }
+)
+
+# propose_transaction only reads the model, so one instance serves every run
+TX_DATA = SafeTransactionData(
+    to="0xTo",
+    value=0,
+    data="0x",
+    operation=0,
+    safe_tx_gas=0,
+    base_gas=0,
+    gas_price=0,
+    gas_token="0x0000000000000000000000000000000000000000",
+    refund_receiver="0x0000000000000000000000000000000000000000",
+    nonce=1,
+)
+
+
+SERVICE_URL = "https://safe-transaction-mainnet.safe.global"
+
+
+@functools.cache
+def url(path: str, **query: str) -> str:
+    """
+    Returns the service URL for `path`, with `query` encoded in the given order.
+    """
+    return SERVICE_URL + path + ("?" + urlencode(query) if query else "")
+
+
+@pytest.fixture(scope="module")
+def service():
+    # The client only holds a pooled session, which requests_mock intercepts
+    return SafeServiceClient(SERVICE_URL)
+
+
+@pytest.fixture(scope="module")
+def service_api(service):
+    """
+    Mocks the endpoints of the tests that inspect requests, registered once per
+    module. Only the shared client's session is patched. The GET_ROUTES
+    endpoints are served separately, by offline_service.
+    """
+    with requests_mock.Mocker(session=service._session) as m:
+        m.get(url("/v1/owners/0xMultiOwner/safes/"), content=SAFES_BODY)
         m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/multisig-transactions/?executed=true&trusted=true&ordering=-nonce&limit=10&offset=0",
-            json={
-                "results": [
-                    {
-                        "safe": safe_address,
-                        "to": "0xTo",
-                        "value": "0",
-                        "data": None,
-                        "operation": 0,
-                        "gasToken": "0x0000000000000000000000000000000000000000",
-                        "safeTxGas": 0,
-                        "baseGas": 0,
-                        "gasPrice": "0",
-                        "refundReceiver": "0x0000000000000000000000000000000000000000",
-                        "nonce": 1,
-                        "executionDate": "2023-01-02T00:00:00Z",
-                        "submissionDate": "2023-01-01T00:00:00Z",
-                        "modified": "2023-01-02T00:00:00Z",
-                        "blockNumber": 12345,
-                        "transactionHash": "0xTxHash",
-                        "safeTxHash": "0xHash",
-                        "executor": "0xExecutor",
-                        "isExecuted": True,
-                        "isSuccessful": True,
-                        "ethGasPrice": "1000000000",
-                        "maxFeePerGas": "1000000000",
-                        "maxPriorityFeePerGas": "1000000000",
-                        "gasUsed": 21000,
-                        "fee": "21000000000000",
-                        "origin": None,
-                        "dataDecoded": None,
-                        "confirmationsRequired": 2,
-                        "confirmations": [],
-                        "trusted": True,
-                        "signatures": None,
-                    }
-                ]
-            },
-        )
-        txs = service.get_multisig_transactions(
-            safe_address,
-            executed=True,
-            trust=True,
-            ordering="-nonce",
-            limit=10,
-            offset=0,
+            url(
+                "/v1/safes/0xSafeAddress/multisig-transactions/",
+                executed="true",
+                trusted="true",
+                ordering="-nonce",
+                limit="10",
+                offset="0",
+            ),
+            content=EXECUTED_TXS_BODY,
         )
-        assert len(txs) == 1
-        assert txs[0].safe_tx_hash == "0xHash"
-        assert txs[0].is_executed is True
-
-
-def test_propose_transaction(service):
-    safe_address = "0xSafeAddress"
-    tx_data = SafeTransactionData(
-        to="0xTo",
-        value=0,
-        data="0x",
-        operation=0,
-        safe_tx_gas=0,
-        base_gas=0,
-        gas_price=0,
-        gas_token="0x0000000000000000000000000000000000000000",
-        refund_receiver="0x0000000000000000000000000000000000000000",
-        nonce=1,
-    )
-
-    with requests_mock.Mocker() as m:
         m.post(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/multisig-transactions/",
+            url("/v1/safes/0xSafeAddress/multisig-transactions/"),
             status_code=201,
         )
-        service.propose_transaction(
-            safe_address=safe_address,
-            safe_tx_data=tx_data,
-            safe_tx_hash="0xHash",
-            sender_address="0xSender",
-            signature="0xSig",
-        )
-
-        assert m.called
-        assert m.last_request.json()["contractTransactionHash"] == "0xHash"
-
-
-def test_confirm_transaction(service):
-    safe_tx_hash = "0xHash"
-    with requests_mock.Mocker() as m:
         m.post(
-            f"https://safe-transaction-mainnet.safe.global/v1/multisig-transactions/{safe_tx_hash}/confirmations/",
+            url("/v1/multisig-transactions/0xHash/confirmations/"),
             status_code=201,
         )
-        service.confirm_transaction(safe_tx_hash, "0xSig")
-        assert m.called
-        assert m.last_request.json()["signature"] == "0xSig"
+        m.get(url("/v1/safes/0xSafeAddress/"), content=SAFE_INFO_BODY)
+        m.get(url("/v1/safes/0xBroken/"), content=INVALID_SAFE_INFO_BODY)
+        m.get(url("/v1/safes/0xSafe1/"), content=SAFE_1_INFO_BODY)
+        m.get(url("/v1/safes/0xSafe2/"), content=SAFE_2_INFO_BODY)
+        m.post(url("/v1/delegates/"), status_code=201)
+        m.delete(url("/v1/delegates/0xDelegate/"), status_code=204)
+        m.post(url("/v1/data-decoder/"), content=DECODED_DATA_BODY)
+        yield m
 
 
-def test_get_transaction(service):
-    safe_tx_hash = "0xHash"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/multisig-transactions/{safe_tx_hash}/",
-            json={
-                "safe": "0xSafe",
-                "to": "0xTo",
-                "value": "0",
-                "data": None,
-                "operation": 0,
-                "gasToken": "0x0000000000000000000000000000000000000000",
-                "safeTxGas": 0,
-                "baseGas": 0,
-                "gasPrice": "0",
-                "refundReceiver": "0x0000000000000000000000000000000000000000",
-                "nonce": 0,
-                "executionDate": None,
-                "submissionDate": "2023-01-01T00:00:00Z",
-                "modified": "2023-01-01T00:00:00Z",
-                "blockNumber": None,
-                "transactionHash": None,
-                "safeTxHash": safe_tx_hash,
-                "executor": None,
-                "isExecuted": False,
-                "isSuccessful": None,
-                "ethGasPrice": None,
-                "maxFeePerGas": None,
-                "maxPriorityFeePerGas": None,
-                "gasUsed": None,
-                "fee": None,
-                "origin": None,
-                "dataDecoded": None,
-                "confirmationsRequired": 2,
-                "confirmations": [],
-                "trusted": True,
-                "signatures": None,
-            },
+@pytest.fixture
+def api(service_api):
+    # Keep the registered routes, drop the previous test's request history
+    service_api.reset_mock()
+    return service_api
+
+
+# Decode-only GET endpoints, answered by FakeTransport on a client of their
+# own. None of these URLs are registered with requests_mock in service_api.
+GET_ROUTES: dict[str, bytes] = {
+    url("/v1/about/"): SERVICE_INFO_BODY,
+    url(
+        "/v1/safes/0xSafeAddress/multisig-transactions/",
+        executed="false",
+        trusted="true",
+    ): PENDING_TXS_BODY,
+    url("/v1/multisig-transactions/0xHash/"): PENDING_TX_BODY,
+    url("/v1/owners/0xOwner/safes/"): SAFES_BODY,
+    url(
+        "/v1/safes/0xSafe/balances/", trusted="false", exclude_spam="true"
+    ): BALANCES_BODY,
+    url("/v1/safes/0xSafeAddress/creation/"): CREATION_INFO_BODY,
+    url(
+        "/v1/safes/0xSafeAddress/collectibles/",
+        trusted="false",
+        exclude_spam="true",
+    ): COLLECTIBLES_BODY,
+    url("/v1/delegates/", safe="0xSafeAddress"): DELEGATES_BODY,
+    url("/v1/tokens/"): TOKENS_BODY,
+    url("/v1/tokens/0xToken/"): TOKEN_BODY,
+}
+
+# GET endpoints that decode a single response: method, args, check
+GET_CASES: list[tuple[str, tuple[str, ...], Callable[[Any], bool]]] = [
+    (
+        "get_service_info",
+        (),
+        lambda info: info.name == "Safe Transaction Service",
+    ),
+    (
+        "get_pending_transactions",
+        ("0xSafeAddress",),
+        lambda txs: [tx.safe_tx_hash for tx in txs] == ["0xHash"],
+    ),
+    (
+        "get_transaction",
+        ("0xHash",),
+        lambda tx: tx.safe_tx_hash == "0xHash",
+    ),
+    (
+        "get_safes_by_owner",
+        ("0xOwner",),
+        lambda safes: safes == ["0xSafe1", "0xSafe2"],
+    ),
+    (
+        "get_balances",
+        ("0xSafe",),
+        lambda balances: [(b.token_address, b.balance) for b in balances]
+        == [(None, "1000000000000000000"), ("0xToken", "5000000000000000000")],
+    ),
+    (
+        "get_creation_info",
+        ("0xSafeAddress",),
+        lambda creation: (
+            creation.creator,
+            creation.transaction_hash,
+            creation.factory_address,
         )
-        tx = service.get_transaction(safe_tx_hash)
-        assert tx.safe_tx_hash == safe_tx_hash
+        == ("0xCreator", "0xTxHash", "0xFactory"),
+    ),
+    (
+        "get_collectibles",
+        ("0xSafeAddress",),
+        lambda collectibles: [(c.token_name, c.id) for c in collectibles]
+        == [("Cool NFT", "1")],
+    ),
+    (
+        "get_delegates",
+        ("0xSafeAddress",),
+        lambda delegates: [(d.delegate, d.label) for d in delegates]
+        == [("0xDelegate", "My Delegate")],
+    ),
+    (
+        "get_tokens",
+        (),
+        lambda tokens: [(t.address, t.name, t.decimals, t.logo_uri) for t in tokens]
+        == [
+            ("0xToken1", "Token 1", 18, "https://example.com/logo.png"),
+            ("0xToken2", "Token 2", 6, None),
+        ],
+    ),
+    (
+        "get_token",
+        ("0xToken",),
+        lambda token: (token.address, token.symbol, token.decimals)
+        == ("0xToken", "TKN", 18),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def offline_service():
+    # Answers every GET case from a dict lookup instead of requests_mock matchers
+    routes = {("GET", route_url): body for route_url, body in GET_ROUTES.items()}
+    client = SafeServiceClient(SERVICE_URL)
+    client._session.mount("https://", FakeTransport(routes))
+    return client
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "check"),
+    GET_CASES,
+    ids=[case[0] for case in GET_CASES],
+)
+def test_get_endpoint(offline_service, method, args, check):
+    assert check(getattr(offline_service, method)(*args))
+
+
+def test_requests_compressed_responses(service, api):
+    service.get_safe_info("0xSafeAddress")
+    assert "gzip" in api.last_request.headers["Accept-Encoding"]
+
+
+def test_client_reuses_pooled_session():
+    client = SafeServiceClient(SERVICE_URL)
+    # One pooled connection per concurrent worker, kept alive between calls
+    assert isinstance(client._session, requests.Session)
+    adapter = client._session.get_adapter(SERVICE_URL)
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == MAX_CONCURRENT_REQUESTS
+
+
+def test_get_multisig_transactions(service, api):
+    txs = service.get_multisig_transactions(
+        "0xSafeAddress",
+        executed=True,
+        trust=True,
+        ordering="-nonce",
+        limit=10,
+        offset=0,
+    )
+    assert len(txs) == 1
+    assert txs[0].safe_tx_hash == "0xHash"
+    assert txs[0].is_executed is True
 
 
-def test_get_safes_by_owner(service):
-    owner_address = "0xOwner"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/owners/{owner_address}/safes/",
-            json={"safes": ["0xSafe1", "0xSafe2"]},
-        )
-        safes = service.get_safes_by_owner(owner_address)
-        assert safes == ["0xSafe1", "0xSafe2"]
+def test_page_decoder_ignores_unknown_fields():
+    content = orjson.dumps(
+        {"count": 1, "results": [{**INCOMING_TX, "unknownField": True}]}
+    )
 
+    (tx,) = DECODER_INCOMING.decode(content)
 
-def test_get_balances(service):
-    safe_address = "0xSafe"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/balances/?trusted=false&exclude_spam=true",
-            json=[
-                {
-                    "tokenAddress": None,
-                    "token": None,
-                    "balance": "1000000000000000000",
-                },
-                {
-                    "tokenAddress": "0xToken",
-                    "token": {"name": "Token", "symbol": "TKN", "decimals": 18},
-                    "balance": "5000000000000000000",
-                },
-            ],
-        )
-        balances = service.get_balances(safe_address)
-        assert len(balances) == 2
-        assert balances[0].token_address is None
-        assert balances[0].balance == "1000000000000000000"
-        assert balances[1].token_address == "0xToken"
+    assert tx.transaction_hash == "0xTxHash"
+    assert tx.from_ == "0xSender"
+    assert not hasattr(tx, "unknownField")
 
 
-def test_get_safe_info(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/",
-            json={
-                "address": safe_address,
-                "nonce": 5,
-                "threshold": 2,
-                "owners": ["0xOwner1", "0xOwner2", "0xOwner3"],
-                "masterCopy": "0xMasterCopy",
-                "modules": ["0xModule1"],
-                "fallbackHandler": "0xFallbackHandler",
-                "guard": "0x0000000000000000000000000000000000000000",
-                "version": "1.3.0",
-            },
-        )
-        info = service.get_safe_info(safe_address)
-        assert info.address == safe_address
-        assert info.nonce == 5
-        assert info.threshold == 2
-        assert len(info.owners) == 3
-        assert info.version == "1.3.0"
+def test_page_decoder_rejects_invalid_items():
+    content = orjson.dumps({"results": [{"to": "0xSafe"}]})
 
+    with pytest.raises(ValidationError):
+        DECODER_INCOMING.decode(content)
 
-def test_get_creation_info(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/creation/",
-            json={
-                "created": "2023-01-01T00:00:00Z",
-                "creator": "0xCreator",
-                "transactionHash": "0xTxHash",
-                "factoryAddress": "0xFactory",
-                "masterCopy": "0xMasterCopy",
-                "setupData": "0xSetupData",
-            },
-        )
-        creation = service.get_creation_info(safe_address)
-        assert creation.creator == "0xCreator"
-        assert creation.transaction_hash == "0xTxHash"
-        assert creation.factory_address == "0xFactory"
 
+def test_propose_transaction(service, api):
+    service.propose_transaction(
+        safe_address="0xSafeAddress",
+        safe_tx_data=TX_DATA,
+        safe_tx_hash="0xHash",
+        sender_address="0xSender",
+        signature="0xSig",
+    )
 
-def test_get_collectibles(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/safes/{safe_address}/collectibles/?trusted=false&exclude_spam=true",
-            json=[
-                {
-                    "address": "0xNFTContract",
-                    "tokenName": "Cool NFT",
-                    "tokenSymbol": "CNFT",
-                    "logoUri": "https://example.com/logo.png",
-                    "id": "1",
-                    "uri": "https://example.com/token/1",
-                    "name": "Cool NFT #1",
-                    "description": "A very cool NFT",
-                    "imageUri": "https://example.com/image.png",
-                    "metadata": {"trait": "rare"},
-                }
-            ],
-        )
-        collectibles = service.get_collectibles(safe_address)
-        assert len(collectibles) == 1
-        assert collectibles[0].token_name == "Cool NFT"
-        assert collectibles[0].id == "1"
+    assert api.called
+    assert api.last_request.body == json_backend.dumps(
+        {
+            "to": "0xTo",
+            "value": 0,
+            "data": "0x",
+            "operation": 0,
+            "safeTxGas": 0,
+            "baseGas": 0,
+            "gasPrice": 0,
+            "gasToken": "0x0000000000000000000000000000000000000000",
+            "refundReceiver": "0x0000000000000000000000000000000000000000",
+            "nonce": 1,
+            "contractTransactionHash": "0xHash",
+            "sender": "0xSender",
+            "signature": "0xSig",
+            "origin": None,
+        }
+    )
 
 
-def test_get_delegates(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/delegates/?safe={safe_address}",
-            json={
-                "results": [
-                    {
-                        "safe": safe_address,
-                        "delegate": "0xDelegate",
-                        "delegator": "0xDelegator",
-                        "label": "My Delegate",
-                    }
-                ]
-            },
-        )
-        delegates = service.get_delegates(safe_address)
-        assert len(delegates) == 1
-        assert delegates[0].delegate == "0xDelegate"
-        assert delegates[0].label == "My Delegate"
+def test_confirm_transaction(service, api):
+    service.confirm_transaction("0xHash", "0xSig")
+    assert api.called
+    assert api.last_request.json()["signature"] == "0xSig"
 
 
-def test_add_delegate(service):
-    safe_address = "0xSafeAddress"
-    with requests_mock.Mocker() as m:
-        m.post(
-            "https://safe-transaction-mainnet.safe.global/v1/delegates/",
-            status_code=201,
-        )
-        service.add_delegate(
-            safe_address=safe_address,
-            delegate_address="0xDelegate",
-            delegator="0xDelegator",
-            label="My Delegate",
-            signature="0xSig",
-        )
-        assert m.called
-        assert m.last_request.json()["delegate"] == "0xDelegate"
-        assert m.last_request.json()["label"] == "My Delegate"
+def test_get_safe_info(service, api):
+    info = service.get_safe_info("0xSafeAddress")
+    assert info.address == "0xSafeAddress"
+    assert info.nonce == 5
+    assert info.threshold == 2
+    assert len(info.owners) == 3
+    assert info.version == "1.3.0"
+    with pytest.raises(ValidationError):
+        info.nonce = 6
 
 
-def test_remove_delegate(service):
-    delegate_address = "0xDelegate"
-    with requests_mock.Mocker() as m:
-        m.delete(
-            f"https://safe-transaction-mainnet.safe.global/v1/delegates/{delegate_address}/",
-            status_code=204,
-        )
-        service.remove_delegate(
-            delegate_address=delegate_address,
-            delegator="0xDelegator",
-            signature="0xSig",
-        )
-        assert m.called
-        assert m.last_request.json()["delegator"] == "0xDelegator"
+def test_get_safe_info_invalid_payload(service, api):
+    with pytest.raises(SafeServiceError):
+        service.get_safe_info("0xBroken")
 
 
-def test_get_tokens(service):
-    with requests_mock.Mocker() as m:
-        m.get(
-            "https://safe-transaction-mainnet.safe.global/v1/tokens/",
-            json={
-                "results": [
-                    {
-                        "address": "0xToken1",
-                        "name": "Token 1",
-                        "symbol": "TKN1",
-                        "decimals": 18,
-                        "logoUri": "https://example.com/logo1.png",
-                    },
-                    {
-                        "address": "0xToken2",
-                        "name": "Token 2",
-                        "symbol": "TKN2",
-                        "decimals": 6,
-                        "logoUri": None,
-                    },
-                ]
-            },
-        )
-        tokens = service.get_tokens()
-        assert len(tokens) == 2
-        assert tokens[0].address == "0xToken1"
-        assert tokens[0].name == "Token 1"
-        assert tokens[0].decimals == 18
-        assert tokens[1].logo_uri is None
+def test_get_safes_with_info_by_owner(service, api):
+    safes = service.get_safes_with_info_by_owner("0xMultiOwner")
+    assert [address for address, _ in safes] == ["0xSafe1", "0xSafe2"]
+    assert [info.nonce for _, info in safes] == [0, 1]
+    assert api.call_count == 3
 
 
-def test_get_token(service):
-    token_address = "0xToken"
-    with requests_mock.Mocker() as m:
-        m.get(
-            f"https://safe-transaction-mainnet.safe.global/v1/tokens/{token_address}/",
-            json={
-                "address": token_address,
-                "name": "Token",
-                "symbol": "TKN",
-                "decimals": 18,
-                "logoUri": "https://example.com/logo.png",
-            },
-        )
-        token = service.get_token(token_address)
-        assert token.address == token_address
-        assert token.symbol == "TKN"
-        assert token.decimals == 18
+def test_add_delegate(service, api):
+    service.add_delegate(
+        safe_address="0xSafeAddress",
+        delegate_address="0xDelegate",
+        delegator="0xDelegator",
+        label="My Delegate",
+        signature="0xSig",
+    )
+    assert api.called
+    assert api.last_request.json()["delegate"] == "0xDelegate"
+    assert api.last_request.json()["label"] == "My Delegate"
 
 
-def test_decode_data(service):
-    data = "0x123456"
-    with requests_mock.Mocker() as m:
-        m.post(
-            "https://safe-transaction-mainnet.safe.global/v1/data-decoder/",
-            json={
-                "method": "transfer",
-                "parameters": [
-                    {"name": "to", "type": "address", "value": "0xRecipient"},
-                    {"name": "value", "type": "uint256", "value": "100"},
-                ],
-            },
-        )
-        decoded = service.decode_data(data)
-        assert decoded.method == "transfer"
-        assert len(decoded.parameters) == 2
-        assert decoded.parameters[0]["value"] == "0xRecipient"
+def test_remove_delegate(service, api):
+    service.remove_delegate(
+        delegate_address="0xDelegate",
+        delegator="0xDelegator",
+        signature="0xSig",
+    )
+    assert api.called
+    assert api.last_request.json()["delegator"] == "0xDelegator"
+
+
+def test_decode_data(service, api):
+    decoded = service.decode_data("0x123456")
+    assert decoded.method == "transfer"
+    assert len(decoded.parameters) == 2
+    assert decoded.parameters[0]["value"] == "0xRecipient"
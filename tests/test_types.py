@@ -0,0 +1,178 @@
+import pytest
+from eth_account.messages import encode_typed_data
+
+from safe_kit.types import (
+    DECODER_DELEGATES,
+    SafeDelegateResponse,
+    SafeTransaction,
+    SafeTransactionData,
+)
+
+SAFE_ADDRESS = "0x0987654321098765432109876543210987654321"
+
+
+def test_get_eip712_data():
+    tx_data = SafeTransactionData(
+        to="0x1234567890123456789012345678901234567890",
+        value=100,
+        data="0xabcdef",
+        nonce=3,
+    )
+
+    eip712_data = tx_data.get_eip712_data(1, SAFE_ADDRESS)
+    signable_message = encode_typed_data(full_message=eip712_data)
+
+    assert eip712_data["primaryType"] == "SafeTx"
+    assert eip712_data["domain"] == {"chainId": 1, "verifyingContract": SAFE_ADDRESS}
+    assert signable_message.header.hex() == (
+        "2d5d7deebf9c798135095a7f79598fb26b52cc72cf72147fb8ce9ed10cf45bf6"
+    )
+    assert signable_message.body.hex() == (
+        "9664c8450b4746cf1d300ad8162c25ab11da48aeaa52fb656616e7004aabedbb"
+    )
+
+
+def test_get_eip712_data_shares_types():
+    tx_data = SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x")
+
+    first = tx_data.get_eip712_data(1, SAFE_ADDRESS)
+    encode_typed_data(full_message=first)
+    second = tx_data.get_eip712_data(1, SAFE_ADDRESS)
+
+    assert first["types"] is second["types"]
+    assert "EIP712Domain" in second["types"]
+
+
+def test_data_bytes_follows_data_changes():
+    tx_data = SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0xabcdef")
+
+    assert tx_data.data_bytes == b"\xab\xcd\xef"
+
+    tx_data.data = "0x1234"
+    assert tx_data.data_bytes == b"\x12\x34"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [("0x1", b"\x01"), ("0XABCD", b"\xab\xcd"), ("abcd", b"\xab\xcd"), ("", b"")],
+)
+def test_data_bytes_accepts_loose_hex(data, expected):
+    tx_data = SafeTransactionData(to=SAFE_ADDRESS, value=0, data=data)
+
+    assert tx_data.data_bytes == expected
+    assert tx_data.multisend_encoded_len == 85 + len(expected)
+
+
+def test_sorted_signatures_bytes_refreshes_on_add_signature():
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature("0x" + "22" * 20, "0x" + "bb" * 65)
+    assert tx.sorted_signatures_bytes == b"\xbb" * 65
+
+    tx.add_signature("0x" + "11" * 20, "0x" + "aa" * 65)
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+
+
+def test_sorted_signatures_bytes_with_initial_signatures():
+    owner_a, owner_b, owner_c = ("0x" + byte * 20 for byte in ("0a", "0b", "0c"))
+    tx = SafeTransaction(
+        data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"),
+        signatures={owner_c: "0x" + "cc" * 65, owner_a: "0x" + "aa" * 65},
+    )
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xcc" * 65
+
+    tx.add_signature(owner_b, "0x" + "bb" * 65)
+    tx.add_signature(owner_a, "0x" + "a0" * 65)
+    assert tx.sorted_signatures_bytes == b"\xa0" * 65 + b"\xbb" * 65 + b"\xcc" * 65
+
+
+def test_sorted_signatures_bytes_mixed_case_owners():
+    # Checksum casing must not affect the numeric owner order
+    low_owner = "0xaB" + "00" * 19
+    high_owner = "0xB0" + "00" * 19
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature(high_owner, "0x" + "bb" * 65)
+    tx.add_signature(low_owner, "0x" + "aa" * 65)
+
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+
+
+def test_sorted_signatures_bytes_follows_direct_edits():
+    owner_a, owner_b = ("0x" + byte * 20 for byte in ("0a", "0b"))
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature(owner_a, "0x" + "01" * 65)
+    assert tx.sorted_signatures_bytes == b"\x01" * 65
+
+    tx.signatures[owner_a] = "0x" + "02" * 65
+    assert tx.sorted_signatures_bytes == b"\x02" * 65
+
+    tx.signatures = {owner_b: "0x" + "bb" * 65}
+    assert tx.sorted_signatures_bytes == b"\xbb" * 65
+
+
+def test_sorted_signatures_bytes_after_same_size_owner_swap():
+    owner_a, owner_b, owner_c = ("0x" + byte * 20 for byte in ("0a", "0b", "0c"))
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature(owner_a, "0x" + "aa" * 65)
+    tx.add_signature(owner_b, "0x" + "bb" * 65)
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+
+    # Same number of signatures, different owners
+    del tx.signatures[owner_a]
+    tx.signatures[owner_c] = "0x" + "cc" * 65
+    assert tx.sorted_signatures_bytes == b"\xbb" * 65 + b"\xcc" * 65
+
+    tx.add_signature(owner_a, "0x" + "a0" * 65)
+    assert tx.sorted_signatures_bytes == b"\xa0" * 65 + b"\xbb" * 65 + b"\xcc" * 65
+
+
+def test_sorted_signatures_bytes_after_model_copy():
+    owner_a, owner_b = ("0x" + byte * 20 for byte in ("0a", "0b"))
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature(owner_b, "0x" + "bb" * 65)
+    assert tx.sorted_signatures_bytes == b"\xbb" * 65
+
+    tx_copy = tx.model_copy(deep=True)
+    tx_copy.add_signature(owner_a, "0x" + "aa" * 65)
+    assert tx_copy.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+    assert tx.sorted_signatures_bytes == b"\xbb" * 65
+
+    # A shallow copy shares the signatures dict, so both report both signatures
+    shallow_copy = tx.model_copy()
+    shallow_copy.add_signature(owner_a, "0x" + "aa" * 65)
+    assert len(tx.signatures) == 2
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+
+
+def test_add_signature_on_copy_leaves_original():
+    owner_a, owner_b, owner_c = ("0x" + byte * 20 for byte in ("0a", "0b", "0c"))
+    tx = SafeTransaction(data=SafeTransactionData(to=SAFE_ADDRESS, value=0, data="0x"))
+    tx.add_signature(owner_a, "0x" + "aa" * 65)
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65
+    tx.add_signature(owner_b, "0x" + "bb" * 65)
+
+    tx_copy = tx.model_copy(update={"signatures": dict(tx.signatures)})
+    tx_copy.add_signature(owner_c, "0x" + "cc" * 65)
+
+    assert tx.sorted_signatures_bytes == b"\xaa" * 65 + b"\xbb" * 65
+    assert tx_copy.sorted_signatures_bytes == (
+        b"\xaa" * 65 + b"\xbb" * 65 + b"\xcc" * 65
+    )
+
+
+def test_page_decoder():
+    content = (
+        b'{"count": 1, "results": [{"safe": "0xSafe", "delegate": "0xDelegate", '
+        b'"delegator": "0xDelegator", "label": "Bot", "expiryDate": null}]}'
+    )
+
+    delegates = DECODER_DELEGATES.decode(content)
+
+    assert delegates == [
+        SafeDelegateResponse(
+            safe="0xSafe",
+            delegate="0xDelegate",
+            delegator="0xDelegator",
+            label="Bot",
+        )
+    ]
+    assert DECODER_DELEGATES.decode(b"") == []